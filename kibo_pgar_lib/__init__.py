@@ -10,6 +10,7 @@ from kibo_pgar_lib.file_service import FileService
 from kibo_pgar_lib.input_data import InputData
 from kibo_pgar_lib.known_problems import KnownProblems
 from kibo_pgar_lib.menu import Menu
+from kibo_pgar_lib.object_store import ObjectStore
 from kibo_pgar_lib.pretty_strings import PrettyStrings
 from kibo_pgar_lib.pretty_tables import Alignment, CommandLineTable
-from kibo_pgar_lib.random_draws import RandomDraws
+from kibo_pgar_lib.random_draws import AliasSampler, RandomDraws, RandomStream
@@ -0,0 +1,291 @@
+"""Module for the Benchmarks class.
+
+It can be run as a script, use `python -m kibo_pgar_lib.benchmarks --help` to see its options.
+"""
+
+# Standard Modules
+import argparse
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+# Internal Modules
+from kibo_pgar_lib.known_problems import KnownProblems
+from kibo_pgar_lib.pretty_tables import CommandLineTable
+
+
+class Benchmarks:
+    """
+    This class times the methods of KnownProblems across a ladder of input sizes, saves the
+    results as JSON and compares them against a saved baseline to catch performance regressions.
+    """
+
+    _ERRORS: dict[str, str] = {
+        "constructor": "This class is not instantiable!",
+        "unknown_case": "Unknown benchmark case %s.",
+    }
+
+    _SEED: int = 0
+    _MIN_EXPONENT: int = 3
+    _MAX_EXPONENT: int = 8
+    _HEADERS: list[str] = ["Case", "Size", "Seconds", "Baseline", "Peak KiB", "Status"]
+
+    # Every case has the biggest exponent it can reasonably run with, a function building the
+    # arguments for a given size, which is not timed, and the function to time.
+    _CASES: dict[str, tuple[int, Callable[[int], tuple], Callable[..., Any]]] = {
+        "sieve_of_eratosthenes": (
+            8,
+            lambda n: (n,),
+            KnownProblems.sieve_of_eratosthenes,
+        ),
+        "sieve_of_atkin": (8, lambda n: (n,), KnownProblems.sieve_of_atkin),
+        "mcd": (
+            7,
+            lambda n: ([12 * value for value in Benchmarks._random_integers(n)],),
+            KnownProblems.mcd,
+        ),
+        "mcm": (5, lambda n: (list(range(1, n + 1)),), KnownProblems.mcm),
+        "count_integer_digits": (
+            7,
+            lambda n: (Benchmarks._random_integers(n),),
+            KnownProblems.count_integer_digits_many,
+        ),
+        "count_decimal_digits": (
+            7,
+            lambda n: (Benchmarks._random_floats(n),),
+            KnownProblems.count_decimal_digits_many,
+        ),
+    }
+
+    def __init__(self) -> None:
+        """Prevents the instantiation of this class.
+
+        Raises
+        ------
+        - `NotImplementedError`
+        """
+        raise NotImplementedError(Benchmarks._ERRORS["constructor"])
+
+    @staticmethod
+    def _random_integers(n: int) -> list[int]:
+        """Draws `n` integers of very different magnitudes, always with the same seed.
+
+        Params
+        ------
+        - `n` -> The number of integers to draw.
+
+        Returns
+        -------
+        A list of the drawn integers.
+        """
+        rand: random.Random = random.Random(Benchmarks._SEED)
+
+        return [rand.getrandbits(rand.randint(1, 64)) for _ in range(n)]
+
+    @staticmethod
+    def _random_floats(n: int) -> list[float]:
+        """Draws `n` floats of very different magnitudes, always with the same seed.
+
+        Params
+        ------
+        - `n` -> The number of floats to draw.
+
+        Returns
+        -------
+        A list of the drawn floats.
+        """
+        rand: random.Random = random.Random(Benchmarks._SEED)
+
+        return [rand.random() * 10 ** rand.randint(-10, 10) for _ in range(n)]
+
+    @staticmethod
+    def measure(
+        function: Callable[..., Any], args: tuple, repeat: int = 3
+    ) -> dict[str, float]:
+        """Measures the execution of a function, its best time out of `repeat` runs and, with one
+        more run under tracemalloc, its peak of allocated memory. Every timed run calls the
+        function enough times in a loop to last at least 0.2 seconds, so fast functions aren't
+        measured below the timer resolution and the noise of the system.
+
+        Params
+        ------
+        - `function` -> The function to measure.
+        - `args` -> The arguments to call the function with.
+        - `repeat` -> The number of timed runs, default: 3.
+
+        Returns
+        -------
+        A dictionary with the best time of a single call in `seconds`, the calls made in every
+        timed run in `loops` and the memory peak in `peak_bytes`.
+        """
+        timer: timeit.Timer = timeit.Timer(lambda: function(*args))
+        loops, _ = timer.autorange()
+        best: float = min(timer.repeat(repeat, loops)) / loops
+
+        tracemalloc.start()
+        try:
+            function(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        return {"seconds": best, "loops": loops, "peak_bytes": peak}
+
+    @staticmethod
+    def run(
+        cases: list[str] | None = None,
+        max_exponent: int = _MAX_EXPONENT,
+        repeat: int = 3,
+    ) -> dict[str, Any]:
+        """Runs the benchmark cases for every size from 10^3 up to 10^`max_exponent`, stopping
+        each case at its own biggest reasonable size.
+
+        Params
+        ------
+        - `cases` -> The names of the cases to run, None for all of them, default: None.
+        - `max_exponent` -> The exponent of the biggest size to run, default: 8.
+        - `repeat` -> The number of timed runs for every measure, default: 3.
+
+        Returns
+        -------
+        A dictionary, ready to be saved as JSON, with the environment and the results of every case
+        by size.
+
+        Raises
+        ------
+        - `ValueError` -> If a case is unknown.
+        """
+        results: dict[str, dict[str, dict[str, float]]] = {}
+
+        for name in cases or list(Benchmarks._CASES):
+            if name not in Benchmarks._CASES:
+                raise ValueError(Benchmarks._ERRORS["unknown_case"] % name)
+
+            case_max_exponent, setup, function = Benchmarks._CASES[name]
+            results[name] = {}
+
+            for exponent in range(
+                Benchmarks._MIN_EXPONENT, min(max_exponent, case_max_exponent) + 1
+            ):
+                size: int = 10**exponent
+                results[name][str(size)] = Benchmarks.measure(
+                    function, setup(size), repeat
+                )
+
+        return {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+
+    @staticmethod
+    def compare(
+        current: dict[str, Any], baseline: dict[str, Any], threshold: float
+    ) -> tuple[CommandLineTable, int]:
+        """Compares some results against a baseline. A measure is a regression if its time, or
+        its memory peak, is more than `threshold` times worse than the baseline one.
+
+        Params
+        ------
+        - `current` -> The results to check, as given by `run(...)`.
+        - `baseline` -> The baseline results, as given by `run(...)`.
+        - `threshold` -> The tolerated relative worsening, for example 0.2 for 20%.
+
+        Returns
+        -------
+        A tuple with the table of the comparison and the number of regressions found.
+        """
+        table: CommandLineTable = CommandLineTable()
+        table.headers = Benchmarks._HEADERS
+        regressions: int = 0
+
+        for name, sizes in current["results"].items():
+            for size, measure in sizes.items():
+                base: dict[str, float] | None = (
+                    baseline.get("results", {}).get(name, {}).get(size)
+                )
+                status: str = "new"
+
+                if base is not None:
+                    slower: bool = measure["seconds"] > base["seconds"] * (
+                        1 + threshold
+                    )
+                    bigger: bool = measure["peak_bytes"] > base["peak_bytes"] * (
+                        1 + threshold
+                    )
+                    status = "REGRESSION" if slower or bigger else "ok"
+                    regressions += int(slower or bigger)
+
+                table.add_rows(
+                    [
+                        [
+                            name,
+                            size,
+                            f"{measure['seconds']:.6f}",
+                            "-" if base is None else f"{base['seconds']:.6f}",
+                            measure["peak_bytes"] // 1024,
+                            status,
+                        ]
+                    ]
+                )
+
+        return table, regressions
+
+    @staticmethod
+    def main(argv: list[str] | None = None) -> int:
+        """Entry point of the benchmarks script. Runs the benchmarks, prints them, optionally saves
+        them and compares them against a baseline.
+
+        Params
+        ------
+        - `argv` -> The command line arguments, None to use the ones of the process, default: None.
+
+        Returns
+        -------
+        The exit code of the script, 1 if any regression was found, 0 otherwise.
+        """
+        parser: argparse.ArgumentParser = argparse.ArgumentParser(
+            prog="python -m kibo_pgar_lib.benchmarks",
+            description="Times the KnownProblems methods across growing input sizes.",
+        )
+        parser.add_argument(
+            "cases", nargs="*", help=f"Cases to run: {', '.join(Benchmarks._CASES)}."
+        )
+        parser.add_argument(
+            "--max-exponent", type=int, default=Benchmarks._MAX_EXPONENT
+        )
+        parser.add_argument("--repeat", type=int, default=3)
+        parser.add_argument("--output", help="File where to save the results as JSON.")
+        parser.add_argument("--baseline", help="JSON results to compare against.")
+        parser.add_argument("--threshold", type=float, default=0.2)
+        args: argparse.Namespace = parser.parse_args(argv)
+
+        try:
+            current: dict[str, Any] = Benchmarks.run(
+                args.cases, args.max_exponent, args.repeat
+            )
+        except ValueError as error:
+            parser.error(str(error))
+
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(current, f, indent=2)
+
+        baseline: dict[str, Any] = {}
+        if args.baseline:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+
+        table, regressions = Benchmarks.compare(current, baseline, args.threshold)
+        print(table)
+
+        return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(Benchmarks.main())
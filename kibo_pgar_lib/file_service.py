@@ -1,13 +1,175 @@
 """Module representing the FileService class"""
 
+# pylint: disable=too-many-lines
+
 # Standard Modules
+import asyncio
+import atexit
+import bz2
+import codecs
+import contextlib
+import gzip
+import io
+import itertools
+import json
+import lzma
+import marshal
+import mmap
+import os
 import pickle
+import struct
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, reduce
+from stat import S_IMODE
+from typing import IO, Any
 
 # Internal Modules
 from kibo_pgar_lib.pretty_strings import PrettyStrings
 from kibo_pgar_lib.ansi_colors import AnsiFontColors, AnsiFontWeights
 
 
+class _ZlibFile(io.RawIOBase):
+    """Minimal file object that streams its content through zlib, since the module doesn't
+    provide one like gzip, bz2 and lzma do. When reading, concatenated zlib streams, as left by
+    appending to a file, are read one after the other.
+    """
+
+    _CHUNK_SIZE: int = 1 << 16
+
+    def __init__(self, raw: IO[bytes], mode: str, level: int = -1) -> None:
+        """Wraps the given raw file.
+
+        Params
+        ------
+        - `raw` -> The underlying binary file, opened with the same mode.
+        - `mode` -> The mode of the file: "rb", "wb" or "ab".
+        - `level` -> The compression level, from 0 to 9 or -1 for the default one, default: -1.
+        """
+        super().__init__()
+        self._raw: IO[bytes] = raw
+        self._reading: bool = mode == "rb"
+        self._compressor = zlib.compressobj(level)
+        self._decompressor = zlib.decompressobj()
+
+    def readable(self) -> bool:
+        return self._reading
+
+    def writable(self) -> bool:
+        return not self._reading
+
+    def write(self, b: bytes) -> int:
+        self._raw.write(self._compressor.compress(b))
+
+        return len(b)
+
+    def readinto(self, b: bytearray) -> int:
+        if not b:
+            return 0
+
+        while True:
+            # Never more than asked is decompressed, the rest of the input is kept for later
+            data: bytes = self._decompressor.unconsumed_tail
+            if self._decompressor.eof:
+                data = self._decompressor.unused_data
+                self._decompressor = zlib.decompressobj()
+
+            # Even without new input the decompressor can have output held back by the limit
+            data = data or self._raw.read(_ZlibFile._CHUNK_SIZE)
+            decompressed: bytes = self._decompressor.decompress(data, len(b))
+            if decompressed:
+                b[: len(decompressed)] = decompressed
+                return len(decompressed)
+
+            if not data:
+                return 0
+
+    def close(self) -> None:
+        if not self.closed:
+            if not self._reading:
+                self._raw.write(self._compressor.flush())
+            self._raw.close()
+
+        super().close()
+
+
+class _ChecksumFile(io.RawIOBase):
+    """Minimal file object that computes the CRC32 of the bytes going through it. When reading,
+    the last bytes of the file, where the checksum is saved, are held back and never given to
+    the reader. Closing it doesn't close the underlying file.
+    """
+
+    _CHUNK_SIZE: int = 1 << 16
+
+    def __init__(self, raw: IO[bytes], mode: str, trailer_size: int = 0) -> None:
+        """Wraps the given file.
+
+        Params
+        ------
+        - `raw` -> The underlying binary file.
+        - `mode` -> The mode of the file: "rb" or "wb".
+        - `trailer_size` -> When reading, the number of bytes at the end of the file to hold
+        back, default: 0.
+        """
+        super().__init__()
+        self._raw: IO[bytes] = raw
+        self._reading: bool = mode == "rb"
+        self._trailer_size: int = trailer_size
+        self._pending: bytearray = bytearray()
+        self._eof: bool = False
+        self.checksum: int = 0
+
+    def readable(self) -> bool:
+        return self._reading
+
+    def writable(self) -> bool:
+        return not self._reading
+
+    def write(self, b: bytes) -> int:
+        self.checksum = zlib.crc32(b, self.checksum)
+        self._raw.write(b)
+
+        return memoryview(b).nbytes
+
+    def readinto(self, b: bytearray) -> int:
+        while len(self._pending) <= self._trailer_size and not self._eof:
+            data: bytes = self._raw.read(_ChecksumFile._CHUNK_SIZE)
+            self._pending += data
+            self._eof = not data
+
+        size: int = min(len(b), len(self._pending) - self._trailer_size)
+        if size <= 0:
+            return 0
+
+        b[:size] = self._pending[:size]
+        self.checksum = zlib.crc32(self._pending[:size], self.checksum)
+        del self._pending[:size]
+
+        return size
+
+    def trailer(self) -> bytes:
+        """Reads whatever is left of the file, for the checksum, and gives back the held back
+        bytes.
+
+        Returns
+        -------
+        The bytes at the end of the file, shorter than `trailer_size` if the file is truncated.
+        """
+        while self.readinto(bytearray(_ChecksumFile._CHUNK_SIZE)):
+            pass
+
+        return bytes(self._pending)
+
+
+class _ChecksumError(ValueError):
+    """Raised when the checksum of a file doesn't match its content."""
+
+
 class FileService:
     """
     This class has useful methods to serialize/deserialize objects and save/load them to/from a
@@ -22,7 +184,97 @@ class FileService:
         "file_not_found": "Can't find the file %s\n",
         "reading": "Problem reading the file %s\n",
         "writing": "Problem writing the file %s\n",
+        "truncated": "The file %s ends with a truncated record\n",
+        "compression": "Unknown compression %s, it must be one of: zlib, gzip, bz2, lzma.",
+        "cache_size": "The cache must allow at least one entry and a non-negative number of bytes.",
+        "checksum": "The file %s is corrupted, its checksum doesn't match\n",
+        "backend": "Unknown serializer backend %s.",
+        "backend_name": "The name of a serializer backend must be 1 to 255 bytes long.",
+        "out_of_band": "Only the pickle backend can save buffers out-of-band.",
+        "repeat": "The number of timed runs must be at least 1.",
+        "write_behind_processes": "Saving in background can't be done by worker processes.",
+    }
+
+    # Every record of a stream file is a pickle preceded by its length
+    _FRAME_HEADER: struct.Struct = struct.Struct("<Q")
+    # Stream files start with this, so they are never mistaken for a compressed file
+    _STREAM_MAGIC: bytes = b"KPSTREAM"
+    _MAGIC_NUMBERS: dict[bytes, str] = {
+        b"\x1f\x8b": "gzip",
+        b"BZh": "bz2",
+        b"\xfd7zXZ\x00": "lzma",
+    }
+    _COMPRESSIONS: tuple[str, ...] = ("zlib", "gzip", "bz2", "lzma")
+    _BUFFERS_SUFFIX: str = ".buffers"
+    _BUFFERS_MAGIC: bytes = b"KPBUFFER"
+    _BUFFER_REGION: struct.Struct = struct.Struct("<QQ")
+    _BUFFERS_FOOTER: struct.Struct = struct.Struct("<Q8s")
+    # Buffers smaller than this are not worth a region of their own
+    _OUT_OF_BAND_THRESHOLD: int = 1 << 16
+    _READING_ERRORS: tuple[type[Exception], ...] = (
+        IOError,
+        lzma.LZMAError,
+        zlib.error,
+        pickle.UnpicklingError,
+        ValueError,
+    )
+
+    # Files start with the magic number, the format version, the version of the backend and the
+    # length of its name, followed by the name, the name of the sidecar file of the out-of-band
+    # buffers, empty if there's none, the serialized object, the CRC32 of both of them and the
+    # CRC32 of the out-of-band buffers. Version 1 files have no sidecar name and no CRC32 of the
+    # buffers, their sidecar file is always the one named as the file followed by ".buffers".
+    _SERIAL_MAGIC: bytes = b"KPSERIAL"
+    _SERIAL_VERSION: int = 2
+    _SERIAL_HEADER: struct.Struct = struct.Struct("<8sBBB")
+    _SERIAL_TRAILERS: dict[int, struct.Struct] = {
+        1: struct.Struct("<I"),
+        2: struct.Struct("<II"),
+    }
+    _SIDECAR_REFERENCE: struct.Struct = struct.Struct("<H")
+    # Every backend has its version, a function dumping an object to a binary file and one
+    # loading it back
+    _BACKENDS: dict[
+        str,
+        tuple[int, Callable[[object, IO[bytes]], None], Callable[[IO[bytes]], object]],
+    ] = {
+        "pickle": (
+            pickle.HIGHEST_PROTOCOL,
+            partial(pickle.dump, protocol=pickle.HIGHEST_PROTOCOL),
+            pickle.load,
+        ),
+        "marshal": (marshal.version, marshal.dump, marshal.load),
+        "json": (
+            0,
+            lambda obj, f: json.dump(obj, codecs.getwriter("utf-8")(f)),
+            lambda f: json.load(codecs.getreader("utf-8")(f)),
+        ),
     }
+    # Objects made only of these types can be saved with marshal
+    _PLAIN_TYPES: frozenset[type] = frozenset(
+        (type(None), bool, int, float, complex, str, bytes)
+    )
+    _PLAIN_CONTAINERS: frozenset[type] = frozenset((tuple, list, set, frozenset, dict))
+
+    # The deserialization cache maps absolute paths to the (mtime_ns, size, inode) of the file when
+    # it was loaded, the loaded object and its size, from the least to the most recently used.
+    _CACHE_LOCK = threading.Lock()
+    _cache: OrderedDict[str, tuple[tuple[int, int, int], object, int]] = OrderedDict()
+    _cache_enabled: bool = False
+    _cache_max_entries: int = 128
+    _cache_max_bytes: int | None = None
+    _cache_bytes: int = 0
+    _cache_hits: int = 0
+    _cache_misses: int = 0
+
+    # Saves waiting for the write-behind worker, by absolute path, so a newer save of the same file
+    # replaces the older one, and the path being written right now.
+    _WRITES_CONDITION = threading.Condition()
+    _pending_writes: dict[
+        str, tuple[str, object, str | None, int | None, bool, bool, str]
+    ] = {}
+    _writing: str | None = None
+    _writer: threading.Thread | None = None
 
     def __init__(self) -> None:
         """Prevents instantiation of this class
@@ -35,43 +287,1425 @@ class FileService:
         raise NotImplementedError(FileService._ERRORS["constructor"])
 
     @staticmethod
-    def serialize_object(file_path: str, to_save: object) -> None:
-        """Serialize to file whatever object is given.
+    def _detect_compression(file_path: str) -> str | None:
+        """Detects the compression of a file from its magic number.
 
         Params
         ------
-        - `file_path` -> The file path where to save the serialized object.
-        - `to_save` -> The object to serialize and save.
+        - `file_path` -> The file path of the file to check.
+
+        Returns
+        -------
+        A string with the name of the compression, None if the file is not compressed.
         """
 
-        try:
-            with open(file_path, "wb") as f:
-                pickle.dump(to_save, f)
-        except IOError:
-            print(FileService._ERRORS["red"])
-            print(FileService._ERRORS["writing"] % file_path)
+        with open(file_path, "rb") as f:
+            head: bytes = f.read(6)
+
+        for magic, compression in FileService._MAGIC_NUMBERS.items():
+            if head.startswith(magic):
+                return compression
+
+        # The zlib header is a 0x78 followed by a byte making the pair a multiple of 31
+        if len(head) >= 2 and head[0] == 0x78 and (head[0] << 8 | head[1]) % 31 == 0:
+            return "zlib"
+
+        return None
 
     @staticmethod
-    def deserialize_object(file_path: str) -> object:
-        """Deserialize whatever object is saved in the given file.
+    def _open(
+        file_path: str,
+        mode: str,
+        compression: str | None = None,
+        compression_level: int | None = None,
+    ) -> IO[bytes]:
+        """Opens a binary file that transparently compresses what's written to it, or
+        decompresses what's read from it. When reading, the compression is detected from the
+        magic number of the file.
 
         Params
         ------
-        - `file_path` -> The file path where to find the serialized object.
+        - `file_path` -> The file path of the file to open.
+        - `mode` -> The mode of the file: "rb", "wb" or "ab".
+        - `compression` -> The compression to use when writing, None for no compression,
+        default: None.
+        - `compression_level` -> The compression level, lower is faster, higher is smaller, None
+        for the default of the compression, default: None.
 
         Returns
         -------
-        An instance of the deserialized object.
+        The opened file.
+
+        Raises
+        ------
+        - `ValueError` -> If the compression is unknown.
         """
 
-        try:
-            with open(file_path, "rb") as f:
-                return pickle.load(f)
-        except FileNotFoundError:
-            print(FileService._ERRORS["red"])
-            print(FileService._ERRORS["file_not_found"] % file_path)
-        except (IOError, pickle.UnpicklingError):
-            print(FileService._ERRORS["red"])
-            print(FileService._ERRORS["reading"] % file_path)
+        if mode == "rb":
+            compression = FileService._detect_compression(file_path)
 
-        return None
+        if compression is not None and compression not in FileService._COMPRESSIONS:
+            raise ValueError(FileService._ERRORS["compression"] % compression)
+
+        match compression:
+            case "zlib":
+                raw: _ZlibFile = _ZlibFile(
+                    open(file_path, mode),  # pylint: disable=consider-using-with
+                    mode,
+                    -1 if compression_level is None else compression_level,
+                )
+                return (
+                    io.BufferedReader(raw) if mode == "rb" else io.BufferedWriter(raw)
+                )
+            case "gzip":
+                level: int = 9 if compression_level is None else compression_level
+                return gzip.open(file_path, mode, compresslevel=level)
+            case "bz2":
+                level = 9 if compression_level is None else compression_level
+                return bz2.open(file_path, mode, compresslevel=level)
+            case "lzma":
+                return lzma.open(file_path, mode, preset=compression_level)
+
+        return open(file_path, mode)
+
+    @staticmethod
+    def _buffers_path(file_path: str) -> str:
+        """Gets the path of the sidecar file with the out-of-band buffers of the given file, as it
+        was named by older versions.
+
+        Params
+        ------
+        - `file_path` -> The file path of the serialized object.
+
+        Returns
+        -------
+        A string with the path of the sidecar file.
+        """
+
+        return file_path + FileService._BUFFERS_SUFFIX
+
+    @staticmethod
+    def _dump_out_of_band(to_save: object, f: IO[bytes], buffers_path: str) -> int:
+        """Pickles an object with protocol 5, writing its large buffers to a sidecar file. Every
+        buffer starts at a page aligned offset, and the file ends with a table of the offsets and
+        lengths of the buffers, followed by their number and a magic number.
+
+        Params
+        ------
+        - `to_save` -> The object to pickle.
+        - `f` -> The file where to write the pickle.
+        - `buffers_path` -> The path of the sidecar file.
+
+        Returns
+        -------
+        An integer representing the CRC32 of the buffers, one after the other.
+        """
+
+        regions: list[tuple[int, int]] = []
+        checksum: int = 0
+
+        with open(buffers_path, "wb") as sidecar:
+
+            def save_buffer(buffer: pickle.PickleBuffer) -> bool:
+                nonlocal checksum
+
+                try:
+                    raw: memoryview = buffer.raw()
+                except BufferError:
+                    return True
+
+                # Small buffers stay in the pickle, returning True keeps them in-band
+                if raw.nbytes < FileService._OUT_OF_BAND_THRESHOLD:
+                    return True
+
+                sidecar.write(bytes(-sidecar.tell() % mmap.ALLOCATIONGRANULARITY))
+                regions.append((sidecar.tell(), raw.nbytes))
+                sidecar.write(raw)
+                checksum = zlib.crc32(raw, checksum)
+
+                return False
+
+            pickle.dump(to_save, f, protocol=5, buffer_callback=save_buffer)
+
+            for region in regions:
+                sidecar.write(FileService._BUFFER_REGION.pack(*region))
+            sidecar.write(
+                FileService._BUFFERS_FOOTER.pack(
+                    len(regions), FileService._BUFFERS_MAGIC
+                )
+            )
+
+        return checksum
+
+    @staticmethod
+    def _load_buffers(buffers_path: str) -> list[memoryview]:
+        """Memory-maps a sidecar file written by `_dump_out_of_band(...)`.
+
+        Params
+        ------
+        - `buffers_path` -> The path of the sidecar file.
+
+        Returns
+        -------
+        A list of read-only views on the buffers of the sidecar file.
+
+        Raises
+        ------
+        - `pickle.UnpicklingError` -> If the sidecar file is not valid.
+        """
+
+        with open(buffers_path, "rb") as f:
+            mapped: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        footer: struct.Struct = FileService._BUFFERS_FOOTER
+        region: struct.Struct = FileService._BUFFER_REGION
+
+        if len(mapped) < footer.size:
+            raise pickle.UnpicklingError
+
+        count, magic = footer.unpack_from(mapped, len(mapped) - footer.size)
+        table_offset: int = len(mapped) - footer.size - count * region.size
+        if magic != FileService._BUFFERS_MAGIC or table_offset < 0:
+            raise pickle.UnpicklingError
+
+        view: memoryview = memoryview(mapped)
+
+        return [
+            view[offset : offset + length]
+            for offset, length in region.iter_unpack(
+                view[table_offset : len(mapped) - footer.size]
+            )
+        ]
+
+    @staticmethod
+    def enable_cache(max_entries: int = 128, max_bytes: int | None = None) -> None:
+        """Enables the deserialization cache. While it's enabled, `deserialize_object(...)` keeps
+        the objects it loads and gives them back again as long as their file is unchanged, checking
+        its modification time, size and inode. The least recently used objects are evicted first.
+
+        The cached objects are shared by all the callers, so they must not be modified.
+
+        Params
+        ------
+        - `max_entries` -> The maximum number of cached objects, default: 128.
+        - `max_bytes` -> The maximum total size, measured by the size of their files, of the cached
+        objects, None for no limit, default: None.
+
+        Raises
+        ------
+        - `ValueError` -> If `max_entries` is less than 1 or `max_bytes` is negative.
+        """
+
+        if max_entries < 1 or (max_bytes is not None and max_bytes < 0):
+            raise ValueError(FileService._ERRORS["cache_size"])
+
+        with FileService._CACHE_LOCK:
+            FileService._cache_enabled = True
+            FileService._cache_max_entries = max_entries
+            FileService._cache_max_bytes = max_bytes
+            FileService._evict()
+
+    @staticmethod
+    def disable_cache() -> None:
+        """Disables the deserialization cache, emptying it."""
+
+        with FileService._CACHE_LOCK:
+            FileService._cache_enabled = False
+        FileService.clear_cache()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Empties the deserialization cache and resets its counters."""
+
+        with FileService._CACHE_LOCK:
+            FileService._cache.clear()
+            FileService._cache_bytes = 0
+            FileService._cache_hits = 0
+            FileService._cache_misses = 0
+
+    @staticmethod
+    def cache_info() -> dict[str, int | None]:
+        """Gets the statistics of the deserialization cache.
+
+        Returns
+        -------
+        A dictionary with the number of `hits` and `misses`, the number of cached `entries`, their
+        total size in `bytes` and the `max_entries` and `max_bytes` limits.
+        """
+
+        with FileService._CACHE_LOCK:
+            return {
+                "hits": FileService._cache_hits,
+                "misses": FileService._cache_misses,
+                "entries": len(FileService._cache),
+                "bytes": FileService._cache_bytes,
+                "max_entries": FileService._cache_max_entries,
+                "max_bytes": FileService._cache_max_bytes,
+            }
+
+    @staticmethod
+    def _evict() -> None:
+        """Evicts the least recently used objects until the cache is within its limits. The cache
+        lock must be held.
+        """
+
+        max_bytes: int | None = FileService._cache_max_bytes
+
+        while len(FileService._cache) > FileService._cache_max_entries or (
+            max_bytes is not None and FileService._cache_bytes > max_bytes
+        ):
+            _, (_, _, size) = FileService._cache.popitem(last=False)
+            FileService._cache_bytes -= size
+
+    @staticmethod
+    def _invalidate(file_path: str) -> None:
+        """Removes the object loaded from the given file from the deserialization cache.
+
+        Params
+        ------
+        - `file_path` -> The file path of the object.
+        """
+
+        with FileService._CACHE_LOCK:
+            entry: tuple[tuple[int, int, int], object, int] | None = (
+                FileService._cache.pop(os.path.abspath(file_path), None)
+            )
+            if entry is not None:
+                FileService._cache_bytes -= entry[2]
+
+    @staticmethod
+    def register_backend(
+        name: str,
+        dump: Callable[[object, IO[bytes]], None],
+        load: Callable[[IO[bytes]], object],
+        version: int = 0,
+    ) -> None:
+        """Registers a serializer backend, or replaces the one with the same name. The name and
+        the version of the backend are saved in the files, so a file can only be loaded if a
+        backend with its name and the same or a higher version is registered.
+
+        Params
+        ------
+        - `name` -> The name of the backend.
+        - `dump` -> The function writing an object to a binary file.
+        - `load` -> The function reading an object from a binary file.
+        - `version` -> The version of the format of the backend, from 0 to 255, default: 0.
+
+        Raises
+        ------
+        - `ValueError` -> If the name is empty or longer than 255 bytes.
+        """
+
+        if not 0 < len(name.encode()) < 256:
+            raise ValueError(FileService._ERRORS["backend_name"])
+
+        FileService._BACKENDS[name] = (version, dump, load)
+
+    @staticmethod
+    def _is_plain(obj: object) -> bool:
+        """Checks if an object is made only of plain builtin types, so it can be saved with
+        marshal.
+
+        Params
+        ------
+        - `obj` -> The object to check.
+
+        Returns
+        -------
+        A boolean that's True if the object is made only of plain builtin types.
+        """
+
+        seen: set[int] = set()
+        stack: list[object] = [obj]
+
+        while stack:
+            item: object = stack.pop()
+            if type(item) in FileService._PLAIN_TYPES:
+                continue
+            if type(item) not in FileService._PLAIN_CONTAINERS:
+                return False
+
+            if id(item) not in seen:
+                seen.add(id(item))
+                if isinstance(item, dict):
+                    stack.extend(item.keys())
+                    stack.extend(item.values())
+                else:
+                    stack.extend(item)
+
+        return True
+
+    @staticmethod
+    def _resolve_backend(backend: str, to_save: object) -> str:
+        """Gets the backend to use to save an object, choosing it if `backend` is "auto".
+
+        Params
+        ------
+        - `backend` -> The name of a backend or "auto".
+        - `to_save` -> The object to save.
+
+        Returns
+        -------
+        A string with the name of the backend, "marshal" for plain builtin objects and "pickle"
+        for everything else when choosing it.
+        """
+
+        if backend != "auto":
+            return backend
+
+        return "marshal" if FileService._is_plain(to_save) else "pickle"
+
+    @staticmethod
+    def _write_payload(
+        to_save: object, f: IO[bytes], backend: str, buffers_path: str | None
+    ) -> None:
+        """Writes an object to a file with the given backend, between its header and its CRC32.
+        The name of the sidecar file is written before the object, and the CRC32 of the buffers
+        saved in it after the one of the object.
+
+        Params
+        ------
+        - `to_save` -> The object to save.
+        - `f` -> The file where to write the object.
+        - `backend` -> The name of the backend.
+        - `buffers_path` -> The path of the sidecar file for the out-of-band buffers, in the same
+        directory of the file, None to keep them in the pickle.
+        """
+
+        version, dump, _ = FileService._BACKENDS[backend]
+        name: bytes = backend.encode()
+
+        f.write(
+            FileService._SERIAL_HEADER.pack(
+                FileService._SERIAL_MAGIC,
+                FileService._SERIAL_VERSION,
+                version,
+                len(name),
+            )
+        )
+        f.write(name)
+
+        checksum: _ChecksumFile = _ChecksumFile(f, "wb")
+        buffers_checksum: int = 0
+        with io.BufferedWriter(checksum) as buffered:
+            sidecar: bytes = (
+                b"" if buffers_path is None else os.path.basename(buffers_path).encode()
+            )
+            buffered.write(FileService._SIDECAR_REFERENCE.pack(len(sidecar)))
+            buffered.write(sidecar)
+
+            if buffers_path is not None:
+                buffers_checksum = FileService._dump_out_of_band(
+                    to_save, buffered, buffers_path
+                )
+            else:
+                dump(to_save, buffered)
+
+        f.write(
+            FileService._SERIAL_TRAILERS[FileService._SERIAL_VERSION].pack(
+                checksum.checksum, buffers_checksum
+            )
+        )
+
+    @staticmethod
+    def _has_header(f: IO[bytes]) -> bool:
+        """Checks, without reading it, if a file starts with a header.
+
+        Params
+        ------
+        - `f` -> The file to check.
+
+        Returns
+        -------
+        A boolean that's False for files saved by older versions.
+        """
+
+        magic: bytes = FileService._SERIAL_MAGIC
+
+        return f.peek(len(magic))[: len(magic)] == magic
+
+    @staticmethod
+    def _read_header(f: IO[bytes]) -> tuple[str, int]:
+        """Reads the header of a file, checking that its backend can load it.
+
+        Params
+        ------
+        - `f` -> The file where to read the header.
+
+        Returns
+        -------
+        A tuple with the name of the backend of the file and the version of its format.
+
+        Raises
+        ------
+        - `pickle.UnpicklingError` -> If the format or the backend of the file are unknown.
+        """
+
+        header: bytes = f.read(FileService._SERIAL_HEADER.size)
+        if len(header) < FileService._SERIAL_HEADER.size:
+            raise EOFError
+
+        _, format_version, version, name_length = FileService._SERIAL_HEADER.unpack(
+            header
+        )
+        if format_version not in FileService._SERIAL_TRAILERS:
+            raise pickle.UnpicklingError
+
+        backend: str = f.read(name_length).decode()
+        if (
+            backend not in FileService._BACKENDS
+            or version > FileService._BACKENDS[backend][0]
+        ):
+            raise pickle.UnpicklingError(FileService._ERRORS["backend"] % backend)
+
+        return backend, format_version
+
+    @staticmethod
+    def _read_sidecar_path(f: IO[bytes], file_path: str) -> str | None:
+        """Reads the name of the sidecar file of the out-of-band buffers, at the start of the
+        payload of a file.
+
+        Params
+        ------
+        - `f` -> The file where to read the name, right after its header.
+        - `file_path` -> The file path of the file.
+
+        Returns
+        -------
+        A string with the path of the sidecar file, None if the file has none.
+        """
+
+        reference: bytes = f.read(FileService._SIDECAR_REFERENCE.size)
+        if len(reference) < FileService._SIDECAR_REFERENCE.size:
+            raise EOFError
+
+        name: str = f.read(FileService._SIDECAR_REFERENCE.unpack(reference)[0]).decode()
+        if not name:
+            return None
+
+        return os.path.join(os.path.dirname(os.path.realpath(file_path)), name)
+
+    @staticmethod
+    def _read_buffers(
+        f: IO[bytes], file_path: str, format_version: int
+    ) -> list[memoryview]:
+        """Memory-maps the out-of-band buffers of the object saved in a file, from the sidecar file
+        it names or, for older files, from the one named as it followed by ".buffers".
+
+        Params
+        ------
+        - `f` -> The file where to read the name of the sidecar file, right after its header.
+        - `file_path` -> The file path of the file.
+        - `format_version` -> The version of the format of the file, 1 for older files.
+
+        Returns
+        -------
+        A list of read-only views on the buffers, empty if the object has none.
+        """
+
+        sidecar_path: str | None = FileService._buffers_path(file_path)
+        if format_version > 1:
+            sidecar_path = FileService._read_sidecar_path(f, file_path)
+        elif not os.path.isfile(sidecar_path):
+            sidecar_path = None
+
+        return [] if sidecar_path is None else FileService._load_buffers(sidecar_path)
+
+    @staticmethod
+    def _replaced_sidecar_path(file_path: str) -> str | None:
+        """Gets the path of the sidecar file named by a file that is about to be replaced.
+
+        Params
+        ------
+        - `file_path` -> The file path of the file.
+
+        Returns
+        -------
+        A string with the path of the sidecar file, None if the file doesn't exist, has no
+        sidecar file or can't be read.
+        """
+
+        try:
+            with FileService._open(file_path, "rb") as f:
+                if FileService._has_header(f) and FileService._read_header(f)[1] > 1:
+                    return FileService._read_sidecar_path(f, file_path)
+        except FileService._READING_ERRORS + (EOFError,):
+            pass
+
+        return None
+
+    @staticmethod
+    def _read_payload(f: IO[bytes], file_path: str) -> object:
+        """Reads an object from a file, with its out-of-band buffers if any, checking its CRC32
+        while it's being read and the one of the buffers once they are mapped. Files without a
+        header are read as plain pickles, as they were saved by older versions.
+
+        Params
+        ------
+        - `f` -> The file where to read the object.
+        - `file_path` -> The file path of the file.
+
+        Returns
+        -------
+        The read object.
+
+        Raises
+        ------
+        - `pickle.UnpicklingError` -> If the header or the backend of the file are unknown, or
+        if a file without a header can't be loaded.
+        - `_ChecksumError` -> If the checksum of the object or of the buffers doesn't match, even
+        if the backend failed to load the object.
+        """
+
+        if not FileService._has_header(f):
+            # Older versions saved plain pickles, of any protocol, and without a checksum any
+            # failure can only be reported as a reading problem
+            try:
+                return pickle.load(
+                    f, buffers=FileService._read_buffers(f, file_path, 1)
+                )
+            except Exception as exception:
+                raise pickle.UnpicklingError from exception
+
+        backend, format_version = FileService._read_header(f)
+        load: Callable[[IO[bytes]], object] = FileService._BACKENDS[backend][2]
+        trailer_format: struct.Struct = FileService._SERIAL_TRAILERS[format_version]
+        checksum: _ChecksumFile = _ChecksumFile(f, "rb", trailer_format.size)
+        buffers_checksum: int = 0
+        loaded: object = None
+        error: Exception | None = None
+
+        with io.BufferedReader(checksum) as buffered:
+            # A corrupted file can make the backend fail in any way, so the checksum decides
+            # whether the error is reported as corruption
+            try:
+                buffers: list[memoryview] = FileService._read_buffers(
+                    buffered, file_path, format_version
+                )
+                buffers_checksum = reduce(
+                    lambda crc, buffer: zlib.crc32(buffer, crc), buffers, 0
+                )
+
+                if backend == "pickle":
+                    load = partial(pickle.load, buffers=buffers)
+                loaded = load(buffered)
+            except Exception as exception:  # pylint: disable=broad-exception-caught
+                # Its frames would keep alive the buffers the backend was reading into
+                error = exception.with_traceback(None)
+
+            # Whatever the backend didn't read still counts for the checksum
+            while buffered.read(io.DEFAULT_BUFFER_SIZE):
+                pass
+
+        trailer: bytes = checksum.trailer()
+        if len(trailer) < trailer_format.size:
+            raise EOFError from error
+        # Version 1 files have only the checksum of the object
+        expected: tuple[int, ...] = trailer_format.unpack(trailer)
+        if expected != (checksum.checksum, buffers_checksum)[: len(expected)]:
+            raise _ChecksumError from error
+        if error is not None:
+            raise error
+
+        return loaded
+
+    @staticmethod
+    def _same_object(obj: object, loaded: object) -> bool:
+        """Checks if an object loaded back by a backend is the same as the saved one. Objects that
+        can't be compared with ==, like NumPy arrays, or that aren't equal to themselves, like
+        NaN, are compared by their pickles.
+
+        Params
+        ------
+        - `obj` -> The saved object.
+        - `loaded` -> The loaded object.
+
+        Returns
+        -------
+        A boolean that's True if the loaded object is the same as the saved one.
+        """
+
+        try:
+            if bool(loaded == obj):
+                return True
+        except (TypeError, ValueError):
+            pass
+
+        try:
+            return pickle.dumps(loaded) == pickle.dumps(obj)
+        except (TypeError, AttributeError, pickle.PicklingError):
+            return False
+
+    @staticmethod
+    def benchmark_backends(obj: object, repeat: int = 3) -> dict[str, dict[str, float]]:
+        """Measures how every backend saves and loads the given object, in memory, to pick the
+        best one for objects shaped like it. Backends that can't save the object, or that don't
+        load back the same object, like json turning tuples into lists, are left out.
+
+        Params
+        ------
+        - `obj` -> The object to save and load.
+        - `repeat` -> The number of timed runs, the best one is kept, default: 3.
+
+        Returns
+        -------
+        A dictionary with, for every backend, the best `encode_seconds` and `decode_seconds`
+        and the `size` in bytes of the saved object.
+
+        Raises
+        ------
+        - `ValueError` -> If `repeat` is less than 1.
+        """
+
+        if repeat < 1:
+            raise ValueError(FileService._ERRORS["repeat"])
+
+        results: dict[str, dict[str, float]] = {}
+
+        for name, (_, dump, load) in FileService._BACKENDS.items():
+            encode: float = float("inf")
+            decode: float = float("inf")
+            buffer: io.BytesIO = io.BytesIO()
+            loaded: object = None
+
+            try:
+                for _ in range(repeat):
+                    buffer = io.BytesIO()
+                    start: float = time.perf_counter()
+                    dump(obj, buffer)
+                    encode = min(encode, time.perf_counter() - start)
+
+                for _ in range(repeat):
+                    buffer.seek(0)
+                    start = time.perf_counter()
+                    loaded = load(buffer)
+                    decode = min(decode, time.perf_counter() - start)
+            except (TypeError, ValueError, pickle.PicklingError):
+                continue
+
+            if FileService._same_object(obj, loaded):
+                results[name] = {
+                    "encode_seconds": encode,
+                    "decode_seconds": decode,
+                    "size": len(buffer.getvalue()),
+                }
+
+        return results
+
+    @staticmethod
+    def _load_object(file_path: str) -> object:
+        """Loads the object saved in the given file, with its out-of-band buffers if any.
+
+        Params
+        ------
+        - `file_path` -> The file path where to find the serialized object.
+
+        Returns
+        -------
+        An instance of the deserialized object.
+        """
+
+        with FileService._open(file_path, "rb") as f:
+            return FileService._read_payload(f, file_path)
+
+    @staticmethod
+    def _load_cached_object(file_path: str) -> object:
+        """Loads the object saved in the given file through the deserialization cache.
+
+        Params
+        ------
+        - `file_path` -> The file path where to find the serialized object.
+
+        Returns
+        -------
+        An instance of the deserialized object, the cached one if its file is unchanged.
+        """
+
+        key: str = os.path.abspath(file_path)
+        # Taken before loading, so a file changed while it's being loaded is loaded again later
+        stat: os.stat_result = os.stat(file_path)
+        validator: tuple[int, int, int] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        with FileService._CACHE_LOCK:
+            entry: tuple[tuple[int, int, int], object, int] | None = (
+                FileService._cache.get(key)
+            )
+            if entry is not None and entry[0] == validator:
+                FileService._cache.move_to_end(key)
+                FileService._cache_hits += 1
+                return entry[1]
+            FileService._cache_misses += 1
+
+        loaded: object = FileService._load_object(file_path)
+
+        with FileService._CACHE_LOCK:
+            max_bytes: int | None = FileService._cache_max_bytes
+            if FileService._cache_enabled and (
+                max_bytes is None or stat.st_size <= max_bytes
+            ):
+                old: tuple[tuple[int, int, int], object, int] | None = (
+                    FileService._cache.pop(key, None)
+                )
+                if old is not None:
+                    FileService._cache_bytes -= old[2]
+
+                FileService._cache[key] = (validator, loaded, stat.st_size)
+                FileService._cache_bytes += stat.st_size
+                FileService._evict()
+
+        return loaded
+
+    @staticmethod
+    def _temporary_path(file_path: str) -> str:
+        """Gets a unique path, in the same directory of the given one, where to write a file
+        before it replaces the given one.
+
+        Params
+        ------
+        - `file_path` -> The file path that will be replaced.
+
+        Returns
+        -------
+        A string with the path of the temporary file.
+        """
+
+        directory, name = os.path.split(file_path)
+
+        return os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+
+    @staticmethod
+    def _copy_mode(file_path: str, *paths: str | None) -> None:
+        """Gives the permissions of a file, if it exists, to the files that will replace it.
+
+        Params
+        ------
+        - `file_path` -> The file path that will be replaced.
+        - `paths` -> The paths of the new files, None ones are skipped.
+        """
+
+        try:
+            mode: int = S_IMODE(os.stat(file_path).st_mode)
+        except FileNotFoundError:
+            return
+
+        for path in paths:
+            if path is not None:
+                os.chmod(path, mode)
+
+    @staticmethod
+    def _fsync(path: str, directory: bool = False) -> None:
+        """Forces the content of a file, or the entries of a directory, to be written on disk.
+
+        Params
+        ------
+        - `path` -> The path of the file or directory.
+        - `directory` -> If the path is a directory, default: False.
+        """
+
+        fd: int = os.open(path, os.O_RDONLY if directory else os.O_RDWR)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    # pylint: disable-next=too-many-arguments, too-many-positional-arguments
+    def _write_object(
+        file_path: str,
+        to_save: object,
+        compression: str | None,
+        compression_level: int | None,
+        out_of_band: bool,
+        fsync: bool,
+        backend: str,
+    ) -> None:
+        """Atomically saves an object, writing it to a temporary file that replaces the given one
+        only once it's complete. The out-of-band buffers, if any, are written to a new sidecar
+        file with a unique name, recorded in the object file, so the single replace of the object
+        file switches both of them. The sidecar file of the replaced object is removed after.
+        Symbolic links are followed, and the new files get the permissions of the replaced one.
+
+        Params
+        ------
+        - `file_path` -> The file path where to save the serialized object.
+        - `to_save` -> The object to serialize and save.
+        - `compression` -> The compression to use, None for no compression.
+        - `compression_level` -> The compression level, None for the default of the compression.
+        - `out_of_band` -> If the large buffers should be saved out-of-band in the sidecar file.
+        - `fsync` -> If the files should be forced on disk before replacing the old ones.
+        - `backend` -> The name of the backend, or "auto".
+        """
+
+        # Through a symbolic link its target is replaced, not the link
+        file_path = os.path.realpath(file_path)
+        temp_path: str = FileService._temporary_path(file_path)
+        buffers_path: str | None = None
+        if out_of_band:
+            buffers_path = (
+                f"{file_path}.{uuid.uuid4().hex}{FileService._BUFFERS_SUFFIX}"
+            )
+        replaced: bool = False
+
+        try:
+            with FileService._open(
+                temp_path, "wb", compression, compression_level
+            ) as f:
+                FileService._write_payload(
+                    to_save,
+                    f,
+                    FileService._resolve_backend(backend, to_save),
+                    buffers_path,
+                )
+
+            if fsync:
+                FileService._fsync(temp_path)
+                if buffers_path is not None:
+                    FileService._fsync(buffers_path)
+
+            FileService._copy_mode(file_path, temp_path, buffers_path)
+            old_buffers_paths: set[str | None] = {
+                FileService._replaced_sidecar_path(file_path),
+                FileService._buffers_path(file_path),
+            }
+            os.replace(temp_path, file_path)
+            replaced = True
+
+            # Nothing refers to the old sidecar files anymore, they are removed only now since
+            # unused buffers are harmless if this is interrupted, and kept if they are in use
+            for path in old_buffers_paths - {None, buffers_path}:
+                with contextlib.suppress(OSError):
+                    os.remove(path)
+
+            # On POSIX the renames are durable only once the directory is on disk too
+            if fsync and os.name == "posix":
+                FileService._fsync(
+                    os.path.dirname(file_path) or os.curdir, directory=True
+                )
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temp_path)
+            if buffers_path is not None and not replaced:
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(buffers_path)
+
+    @staticmethod
+    def _write_behind_worker() -> None:
+        """Body of the write-behind thread, it saves the pending objects one at a time, forever."""
+
+        condition: threading.Condition = FileService._WRITES_CONDITION
+
+        while True:
+            with condition:
+                condition.wait_for(lambda: FileService._pending_writes)
+                key: str = next(iter(FileService._pending_writes))
+                file_path, to_save, *args, backend = FileService._pending_writes.pop(
+                    key
+                )
+                FileService._writing = key
+
+            try:
+                FileService.serialize_object(file_path, to_save, *args, backend=backend)
+            except Exception:  # pylint: disable=broad-exception-caught
+                # The object can't be pickled, the worker must go on with the other ones
+                print(FileService._ERRORS["red"])
+                print(FileService._ERRORS["writing"] % file_path)
+            finally:
+                with condition:
+                    FileService._writing = None
+                    condition.notify_all()
+
+    @staticmethod
+    def _reset_write_behind() -> None:
+        """Forgets the write-behind worker and its pending saves, used in forked processes since
+        only the thread that forked survives in them, the saves are left to the parent. The locks
+        are replaced too, another thread of the parent could have been holding them.
+        """
+
+        FileService._WRITES_CONDITION = threading.Condition()
+        FileService._pending_writes = {}
+        FileService._writing = None
+        FileService._writer = None
+        FileService._CACHE_LOCK = threading.Lock()
+
+    @staticmethod
+    def _wait_for_write(file_path: str) -> None:
+        """Waits until the pending write-behind save of the given file, if any, is on disk.
+
+        Params
+        ------
+        - `file_path` -> The file path of the save to wait for.
+        """
+
+        key: str = os.path.abspath(file_path)
+
+        with FileService._WRITES_CONDITION:
+            FileService._WRITES_CONDITION.wait_for(
+                lambda: key not in FileService._pending_writes
+                and FileService._writing != key
+            )
+
+    @staticmethod
+    def flush() -> None:
+        """Blocks until every object saved with `write_behind` is on disk. It's also called
+        automatically when the interpreter exits.
+        """
+
+        with FileService._WRITES_CONDITION:
+            FileService._WRITES_CONDITION.wait_for(
+                lambda: not FileService._pending_writes and FileService._writing is None
+            )
+
+    @staticmethod
+    # pylint: disable-next=too-many-arguments, too-many-positional-arguments
+    def serialize_object(
+        file_path: str,
+        to_save: object,
+        compression: str | None = None,
+        compression_level: int | None = None,
+        out_of_band: bool = False,
+        fsync: bool = False,
+        write_behind: bool = False,
+        backend: str = "pickle",
+    ) -> None:
+        """Serialize to file whatever object is given. The object can also be compressed, in which
+        case it's streamed through the compressor while it's being serialized.
+
+        The file starts with a small header recording the backend that serialized the object and
+        its version, and ends with the CRC32 of the serialized object, computed while writing it
+        and checked while reading it back.
+
+        The object is written to a temporary file in the same directory, that replaces the given
+        one only once it's complete, so a crash never leaves a truncated file behind. The new file
+        keeps the permissions of the old one, and a symbolic link is followed to replace its
+        target. With `fsync` the file is also forced on disk before replacing the old one.
+
+        With `out_of_band` the large buffers of the object, the ones exposed through
+        pickle.PickleBuffer like NumPy arrays do, are not copied in the pickle but written as they
+        are, in page aligned regions, to a sidecar file named as the given one followed by a
+        unique id and ".buffers". Its name and the CRC32 of the buffers are recorded in the file,
+        so a file is never loaded with the buffers of another save. `deserialize_object(...)`
+        memory-maps them back without copying them.
+
+        With `write_behind` the object is saved later by a background thread and this method
+        returns immediately. If the same file is saved again before that, only the latest object
+        is written. The object must not be modified until it's saved, `flush()` waits for all the
+        pending saves, and `deserialize_object(...)` waits for the one of the file it loads.
+
+        Params
+        ------
+        - `file_path` -> The file path where to save the serialized object.
+        - `to_save` -> The object to serialize and save.
+        - `compression` -> The compression to use: "zlib", "gzip", "bz2", "lzma" or None for no
+        compression, default: None.
+        - `compression_level` -> The compression level, lower is faster, higher is smaller, None
+        for the default of the compression, default: None.
+        - `out_of_band` -> If the large buffers should be saved out-of-band in the sidecar file,
+        default: False.
+        - `fsync` -> If the file should be forced on disk before replacing the old one, default:
+        False.
+        - `write_behind` -> If the object should be saved in background, default: False.
+        - `backend` -> The serializer to use: "pickle", "marshal", "json", any other registered
+        with `register_backend(...)`, or "auto" to use marshal for objects made only of plain
+        builtin types and pickle for everything else, default: "pickle".
+
+        Raises
+        ------
+        - `ValueError` -> If the compression or the backend are unknown, or if `out_of_band` is
+        used with a backend other than pickle.
+        """
+
+        if compression is not None and compression not in FileService._COMPRESSIONS:
+            raise ValueError(FileService._ERRORS["compression"] % compression)
+        if backend != "auto" and backend not in FileService._BACKENDS:
+            raise ValueError(FileService._ERRORS["backend"] % backend)
+        if out_of_band and backend != "pickle":
+            raise ValueError(FileService._ERRORS["out_of_band"])
+
+        if write_behind:
+            with FileService._WRITES_CONDITION:
+                # A pending save of the same file keeps its place in the queue
+                FileService._pending_writes[os.path.abspath(file_path)] = (
+                    file_path,
+                    to_save,
+                    compression,
+                    compression_level,
+                    out_of_band,
+                    fsync,
+                    backend,
+                )
+
+                if FileService._writer is None:
+                    FileService._writer = threading.Thread(
+                        target=FileService._write_behind_worker, daemon=True
+                    )
+                    FileService._writer.start()
+                    atexit.register(FileService.flush)
+
+                FileService._WRITES_CONDITION.notify_all()
+
+            return
+
+        try:
+            FileService._write_object(
+                file_path,
+                to_save,
+                compression,
+                compression_level,
+                out_of_band,
+                fsync,
+                backend,
+            )
+        except IOError:
+            print(FileService._ERRORS["red"])
+            print(FileService._ERRORS["writing"] % file_path)
+        finally:
+            FileService._invalidate(file_path)
+
+    @staticmethod
+    def deserialize_object(file_path: str) -> object:
+        """Deserialize whatever object is saved in the given file. Compressed files are detected
+        and decompressed automatically, the backend is read from the header of the file and the
+        checksum is verified while reading, files saved by older versions without a header are
+        read as plain pickles. If the object was saved with its buffers out-of-band, they are
+        memory-mapped from the sidecar file named in the file, checked against their CRC32 and
+        given back as read-only views, without copying them.
+
+        If the cache is enabled, see `enable_cache(...)`, an unchanged file is loaded only once.
+        A pending write-behind save of the file is waited for before loading it.
+
+        Params
+        ------
+        - `file_path` -> The file path where to find the serialized object.
+
+        Returns
+        -------
+        An instance of the deserialized object.
+        """
+
+        if FileService._writer is not None:
+            FileService._wait_for_write(file_path)
+
+        try:
+            if FileService._cache_enabled:
+                return FileService._load_cached_object(file_path)
+
+            return FileService._load_object(file_path)
+        except FileNotFoundError:
+            print(FileService._ERRORS["red"])
+            print(FileService._ERRORS["file_not_found"] % file_path)
+        except _ChecksumError:
+            print(FileService._ERRORS["red"])
+            print(FileService._ERRORS["checksum"] % file_path)
+        except FileService._READING_ERRORS + (EOFError,):
+            print(FileService._ERRORS["red"])
+            print(FileService._ERRORS["reading"] % file_path)
+
+        return None
+
+    @staticmethod
+    def serialize_stream(
+        file_path: str,
+        iterable: Iterable[object],
+        append: bool = False,
+        compression: str | None = None,
+        compression_level: int | None = None,
+    ) -> None:
+        """Serialize to file every object of the given iterable, one at a time as they are
+        produced, each one as a separate record. This way the objects never need to be all in
+        memory at once.
+
+        Params
+        ------
+        - `file_path` -> The file path where to save the serialized objects.
+        - `iterable` -> The objects to serialize and save.
+        - `append` -> If the objects should be added at the end of an existing file instead of
+        overwriting it, in which case the compression of the existing file is kept, default:
+        False.
+        - `compression` -> The compression to use: "zlib", "gzip", "bz2", "lzma" or None for no
+        compression, default: None.
+        - `compression_level` -> The compression level, lower is faster, higher is smaller, None
+        for the default of the compression, default: None.
+
+        Raises
+        ------
+        - `ValueError` -> If the compression is unknown.
+        """
+
+        try:
+            mode: str = "wb"
+            if append and os.path.isfile(file_path) and os.path.getsize(file_path):
+                mode = "ab"
+                compression = FileService._detect_compression(file_path)
+
+            with FileService._open(
+                file_path, mode, compression, compression_level
+            ) as f:
+                if mode == "wb":
+                    f.write(FileService._STREAM_MAGIC)
+
+                for to_save in iterable:
+                    record: bytes = pickle.dumps(to_save)
+                    f.write(FileService._FRAME_HEADER.pack(len(record)))
+                    f.write(record)
+        except IOError:
+            print(FileService._ERRORS["red"])
+            print(FileService._ERRORS["writing"] % file_path)
+
+    @staticmethod
+    def deserialize_stream(file_path: str) -> Iterator[object]:
+        """Lazily deserialize, one at a time, the objects saved in the given file by
+        `serialize_stream(...)`. Compressed files are detected and decompressed automatically.
+
+        Params
+        ------
+        - `file_path` -> The file path where to find the serialized objects.
+
+        Returns
+        -------
+        An iterator over the deserialized objects, in the order they were saved.
+        """
+
+        header_size: int = FileService._FRAME_HEADER.size
+
+        try:
+            with FileService._open(file_path, "rb") as f:
+                magic: bytes = FileService._STREAM_MAGIC
+                if f.read(len(magic)) != magic:
+                    raise pickle.UnpicklingError
+
+                while header := f.read(header_size):
+                    if len(header) < header_size:
+                        raise EOFError
+
+                    (length,) = FileService._FRAME_HEADER.unpack(header)
+                    record: bytes = f.read(length)
+                    if len(record) < length:
+                        raise EOFError
+
+                    yield pickle.loads(record)
+        except FileNotFoundError:
+            print(FileService._ERRORS["red"])
+            print(FileService._ERRORS["file_not_found"] % file_path)
+        except EOFError:
+            print(FileService._ERRORS["red"])
+            print(FileService._ERRORS["truncated"] % file_path)
+        except FileService._READING_ERRORS:
+            print(FileService._ERRORS["red"])
+            print(FileService._ERRORS["reading"] % file_path)
+
+    @staticmethod
+    # pylint: disable-next=too-many-arguments, too-many-positional-arguments
+    async def serialize_object_async(
+        file_path: str,
+        to_save: object,
+        compression: str | None = None,
+        compression_level: int | None = None,
+        out_of_band: bool = False,
+        executor: Executor | None = None,
+        *,
+        fsync: bool = False,
+        write_behind: bool = False,
+        backend: str = "pickle",
+    ) -> None:
+        """Asynchronous version of `serialize_object(...)`, the serialization and the writing run
+        in an executor so the event loop is never blocked.
+
+        Params
+        ------
+        - `file_path` -> The file path where to save the serialized object.
+        - `to_save` -> The object to serialize and save, it must not be modified until it's saved.
+        - `compression` -> The compression to use: "zlib", "gzip", "bz2", "lzma" or None for no
+        compression, default: None.
+        - `compression_level` -> The compression level, lower is faster, higher is smaller, None
+        for the default of the compression, default: None.
+        - `out_of_band` -> If the large buffers should be saved out-of-band in the sidecar file,
+        default: False.
+        - `executor` -> The executor where to run the serialization, None for the default one of
+        the event loop, default: None.
+        - `fsync` -> If the file should be forced on disk before replacing the old one, default:
+        False.
+        - `write_behind` -> If the object should be saved in background, default: False.
+        - `backend` -> The serializer to use, see `serialize_object(...)`, default: "pickle".
+
+        Raises
+        ------
+        - `ValueError` -> If the compression or the backend are unknown, or if `out_of_band` is
+        used with a backend other than pickle.
+        """
+
+        await asyncio.get_running_loop().run_in_executor(
+            executor,
+            partial(
+                FileService.serialize_object,
+                file_path,
+                to_save,
+                compression=compression,
+                compression_level=compression_level,
+                out_of_band=out_of_band,
+                fsync=fsync,
+                write_behind=write_behind,
+                backend=backend,
+            ),
+        )
+
+    @staticmethod
+    async def deserialize_object_async(
+        file_path: str, executor: Executor | None = None
+    ) -> object:
+        """Asynchronous version of `deserialize_object(...)`, the reading and the deserialization
+        run in an executor so the event loop is never blocked.
+
+        Params
+        ------
+        - `file_path` -> The file path where to find the serialized object.
+        - `executor` -> The executor where to run the deserialization, None for the default one of
+        the event loop, default: None.
+
+        Returns
+        -------
+        An instance of the deserialized object.
+        """
+
+        return await asyncio.get_running_loop().run_in_executor(
+            executor, FileService.deserialize_object, file_path
+        )
+
+    @staticmethod
+    def _map_bounded(
+        function: Callable[..., Any],
+        arguments: Iterable[tuple],
+        max_workers: int | None,
+        use_processes: bool,
+    ) -> Iterator[Any]:
+        """Calls a function on every tuple of arguments in a pool of workers, giving back the
+        results in order. Only a few calls per worker are submitted ahead, so the arguments are
+        consumed, and the results are kept, only a few at a time.
+
+        Params
+        ------
+        - `function` -> The function to call.
+        - `arguments` -> The arguments of every call.
+        - `max_workers` -> The number of workers, None to use all the CPUs.
+        - `use_processes` -> If the workers should be processes instead of threads.
+
+        Returns
+        -------
+        An iterator over the results of the calls, in order.
+        """
+
+        max_workers = max_workers or os.cpu_count() or 1
+        window: int = 2 * max_workers
+        pool: type[Executor] = (
+            ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        )
+
+        with pool(max_workers) as executor:
+            calls: Iterator[tuple] = iter(arguments)
+            pending: deque[Future] = deque(
+                executor.submit(function, *args)
+                for args in itertools.islice(calls, window)
+            )
+
+            try:
+                while pending:
+                    result: Any = pending.popleft().result()
+                    # A new call is submitted before the result is given back, so the workers
+                    # stay busy while it's being used
+                    for args in itertools.islice(calls, 1):
+                        pending.append(executor.submit(function, *args))
+
+                    yield result
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    # pylint: disable-next=too-many-arguments
+    def save_many(
+        to_save: Iterable[tuple[str, object]],
+        max_workers: int | None = None,
+        use_processes: bool = False,
+        compression: str | None = None,
+        compression_level: int | None = None,
+        *,
+        fsync: bool = False,
+        write_behind: bool = False,
+        backend: str = "pickle",
+    ) -> None:
+        """Serialize many objects, each one to its own file, in parallel. Threads are enough when
+        the time goes in writing or compressing, processes also parallelize the pickling, but the
+        objects must then be sent to them.
+
+        Params
+        ------
+        - `to_save` -> The pairs of file path and object to save.
+        - `max_workers` -> The number of workers, None to use all the CPUs, default: None.
+        - `use_processes` -> If the workers should be processes instead of threads, default: False.
+        - `compression` -> The compression to use: "zlib", "gzip", "bz2", "lzma" or None for no
+        compression, default: None.
+        - `compression_level` -> The compression level, lower is faster, higher is smaller, None
+        for the default of the compression, default: None.
+        - `fsync` -> If the files should be forced on disk before replacing the old ones, default:
+        False.
+        - `write_behind` -> If the objects should be saved in background, only with threads,
+        since the saves queued in a worker process would be lost when it exits, default: False.
+        - `backend` -> The serializer to use, see `serialize_object(...)`, default: "pickle".
+
+        Raises
+        ------
+        - `ValueError` -> If the compression or the backend are unknown, or if `write_behind` is
+        used with processes.
+        """
+
+        if use_processes and write_behind:
+            raise ValueError(FileService._ERRORS["write_behind_processes"])
+
+        for _ in FileService._map_bounded(
+            partial(
+                FileService.serialize_object,
+                compression=compression,
+                compression_level=compression_level,
+                fsync=fsync,
+                write_behind=write_behind,
+                backend=backend,
+            ),
+            ((file_path, obj) for file_path, obj in to_save),
+            max_workers,
+            use_processes,
+        ):
+            pass
+
+    @staticmethod
+    def load_many(
+        file_paths: Iterable[str],
+        max_workers: int | None = None,
+        use_processes: bool = False,
+    ) -> list[object]:
+        """Deserialize the objects saved in many files in parallel. With processes the loaded
+        objects are sent back pickled, so out-of-band buffers are copied and the deserialization
+        cache is not used.
+
+        Params
+        ------
+        - `file_paths` -> The file paths where to find the serialized objects.
+        - `max_workers` -> The number of workers, None to use all the CPUs, default: None.
+        - `use_processes` -> If the workers should be processes instead of threads, default: False.
+
+        Returns
+        -------
+        A list with the deserialized objects, in the same order as the file paths.
+        """
+
+        return list(
+            FileService._map_bounded(
+                FileService.deserialize_object,
+                ((file_path,) for file_path in file_paths),
+                max_workers,
+                use_processes,
+            )
+        )
+
+
+if hasattr(os, "register_at_fork"):
+    # pylint: disable-next=protected-access
+    os.register_at_fork(after_in_child=FileService._reset_write_behind)
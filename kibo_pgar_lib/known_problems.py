@@ -1,7 +1,28 @@
 """Module for the KnownProblems class"""
 
+# pylint: disable=too-many-lines, too-many-public-methods
+
 # Standard Modules
+import array
+import bisect
+import itertools
 import math
+import mmap
+import os
+import struct
+import threading
+import uuid
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from decimal import Decimal
+from typing import Any
+
+# Optional Modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class KnownProblems:
@@ -13,7 +34,59 @@ class KnownProblems:
     _ERRORS: dict[str, str] = {
         "constructor": "This class is not instantiable!",
         "values": "Too few arguments were passed!",
+        "negative": "The limit can't be negative!",
+        "cache_file": "The file %s is not a valid prime cache!",
+        "factorize": "Only positive integers can be factorized!",
+        "integer_array": "Only the digits of NumPy integer arrays can be counted!",
     }
+    _POWERS_OF_TEN: list[int] = [10**i for i in range(1, 20)]
+    # A fraction a little smaller than log10(2), used to estimate the digits from the bits
+    _LOG10_2_NUM: int = 30102999566398119521
+    _LOG10_2_DEN: int = 10**20
+    # Number of values reduced by a single math.gcd call before checking for an early exit
+    _REDUCE_CHUNK: int = 1024
+    # Number of odd numbers handled by a single sieve segment, about the size of a L2 cache
+    _SEGMENT_SIZE: int = 1 << 18
+    # Number of odd numbers handled by a single task of the parallel sieve
+    _PARALLEL_SEGMENT_SIZE: int = 1 << 23
+    _worker_base_primes: list[int] = []
+
+    # The prime cache is a table with one bit for every odd number, the i-th bit tells if 2i + 1 is
+    # a prime number. It's either a bytearray that grows in place or a read-only view of a file.
+    _PRIME_CACHE_LOCK = threading.Lock()
+    _PRIME_CACHE_HEADER: struct.Struct = struct.Struct("<4s4xQ")
+    _PRIME_CACHE_MAGIC: bytes = b"KPPC"
+    _BITS_TO_BYTES: list[bytes] = [
+        bytes((byte >> bit) & 1 for bit in range(8)) for byte in range(256)
+    ]
+    _prime_table: bytearray | memoryview = bytearray()
+    _prime_table_limit: int = 0
+
+    # Numbers up to this limit are checked against the prime cache in batch operations
+    _BATCH_SIEVE_LIMIT: int = 10**7
+    _TRIAL_DIVISION_LIMIT: int = 256
+    _MILLER_RABIN_BASES: tuple[int, ...] = (
+        2,
+        3,
+        5,
+        7,
+        11,
+        13,
+        17,
+        19,
+        23,
+        29,
+        31,
+        37,
+        41,
+    )
+    _trial_primes: list[int] = []
+    # Number of steps of the Pollard-Brent rho algorithm between two gcd
+    _RHO_BATCH: int = 128
+    # The phi function of the first few primes is periodic, for each number of primes up to these
+    # there's the period, the count in a period and the counts from 0 to every rest of the period
+    _PHI_TABLE_PRIMES: tuple[int, ...] = (2, 3, 5, 7, 11, 13)
+    _phi_tables: list[tuple[int, int, list[int]]] = []
 
     def __init__(self) -> None:
         """Prevents the instantiation of this class.
@@ -25,25 +98,71 @@ class KnownProblems:
         raise NotImplementedError(KnownProblems._ERRORS["constructor"])
 
     @staticmethod
-    def _mcd(a: int, b: int) -> int:
-        """Finds the MCD (Maximum Common Divider) between two integers.
+    def _check_values(values: Any) -> None:
+        """Checks that there are enough values to calculate the MCD or the MCM.
+
+        Params
+        ------
+        - `values` -> The values to check.
+
+        Raises
+        ------
+        - `ValueError` -> If less than two values are given.
+        """
+        if values is None or len(values) < 2:
+            raise ValueError(KnownProblems._ERRORS["values"])
+
+    @staticmethod
+    def _reduce_mcd(values: Sequence[int]) -> int:
+        """Finds the MCD (Maximum Common Divider) between a sequence of integers, one chunk at a
+        time, stopping as soon as it reaches 1 since it can't get any lower.
 
         Params
         ------
-        - `a` -> The first number to calculate the MCD.
-        - `b` -> The second number to calculate the MCD.
+        - `values` -> The values used to find the MCD.
 
         Returns
         -------
-        An integer representing the MCD.
+        An integer representing the MCD between all the values.
         """
-        while a != 0 and b != 0:
-            if a > b:
-                a %= b
-            else:
-                b %= a
+        mcd: int = 0
+        chunk_size: int = KnownProblems._REDUCE_CHUNK
+
+        for i in range(0, len(values), chunk_size):
+            mcd = math.gcd(mcd, *values[i : i + chunk_size])
+
+            if mcd == 1:
+                break
 
-        return b if a == 0 else a
+        return mcd
+
+    @staticmethod
+    def _reduce_mcm(values: Sequence[int]) -> int:
+        """Finds the MCM (Minimum Common Multiplier) between a sequence of integers, reducing them
+        in pairs like a tree so that the operands of each step have about the same size.
+
+        Params
+        ------
+        - `values` -> The values used to find the MCM.
+
+        Returns
+        -------
+        An integer representing the MCM between all the values.
+        """
+        layer: list[int] = list(values)
+
+        if 0 in layer:
+            return 0
+
+        while len(layer) > 1:
+            next_layer: list[int] = list(map(math.lcm, layer[::2], layer[1::2]))
+
+            if len(layer) % 2:
+                next_layer.append(layer[-1])
+
+            layer = next_layer
+
+        return abs(layer[0])
 
     @staticmethod
     def mcd(values: list[int]) -> int:
@@ -61,62 +180,90 @@ class KnownProblems:
         ------
         - `ValueError` -> If less than two values are given.
         """
-        if not values or len(values) < 2:
-            raise ValueError(KnownProblems._ERRORS["values"])
+        KnownProblems._check_values(values)
 
-        mcd: int = values[0]
+        return KnownProblems._reduce_mcd(values)
 
-        for value in values[1:]:
-            mcd = KnownProblems._mcd(mcd, value)
+    @staticmethod
+    def mcm(values: list[int]) -> int:
+        """Finds the MCM (Minimum Common Multiplier) between a list of integers.
 
-        return mcd
+        Params
+        ------
+        - `values` -> The values used to find the MCM.
+
+        Returns
+        -------
+        An integer representing the MCM between all the values.
+
+        Raises
+        ------
+        - `ValueError` -> If less than two values are given.
+        """
+        KnownProblems._check_values(values)
+
+        return KnownProblems._reduce_mcm(values)
 
     @staticmethod
-    def _mcm(a: int, b: int) -> int:
-        """Finds the MCM (Minimum Common Multiplier) between two numbers.
+    def mcd_rows(rows: Any) -> Any:
+        """Finds the MCD (Maximum Common Divider) of each of the given lists of integers in a
+        single call. If a bi-dimensional NumPy integer array is given the whole computation is
+        vectorized and done row by row.
 
         Params
         ------
-        - `a` -> The first number to calculate the MCM.
-        - `b` -> The second number to calculate the MCM.
+        - `rows` -> An iterable of lists of values used to find the MCDs, or a bi-dimensional
+        NumPy array.
 
         Returns
         -------
-        An integer representing the MCM.
+        A list of integers, or a NumPy array if one was given, representing the MCD of each row.
+
+        Raises
+        ------
+        - `ValueError` -> If any row has less than two values.
         """
-        mcd: int = KnownProblems._mcd(a, b)
+        if numpy is not None and isinstance(rows, numpy.ndarray):
+            if rows.ndim != 2 or rows.shape[1] < 2:
+                raise ValueError(KnownProblems._ERRORS["values"])
+
+            return numpy.gcd.reduce(rows, axis=1)
 
-        return (a * b) // mcd
+        # Every row is checked as it's reached, so the rows can be given by a generator too
+        return [KnownProblems.mcd(row) for row in rows]
 
     @staticmethod
-    def mcm(values: list[int]) -> int:
-        """Finds the MCM (Minimum Common Multiplier) between a list of integers.
+    def mcm_rows(rows: Any) -> Any:
+        """Finds the MCM (Minimum Common Multiplier) of each of the given lists of integers in a
+        single call. If a bi-dimensional NumPy integer array is given the whole computation is
+        vectorized and done row by row, be aware that in this case the results can overflow.
 
         Params
         ------
-        - `values` -> The values used to find the MCM.
+        - `rows` -> An iterable of lists of values used to find the MCMs, or a bi-dimensional
+        NumPy array.
 
         Returns
         -------
-        An integer representing the MCM between all the values.
+        A list of integers, or a NumPy array if one was given, representing the MCM of each row.
 
         Raises
         ------
-        - `ValueError` -> If less than two values are given.
+        - `ValueError` -> If any row has less than two values.
         """
-        if not values or len(values) < 2:
-            raise ValueError(KnownProblems._ERRORS["values"])
-
-        mcm: int = values[0]
+        if numpy is not None and isinstance(rows, numpy.ndarray):
+            if rows.ndim != 2 or rows.shape[1] < 2:
+                raise ValueError(KnownProblems._ERRORS["values"])
 
-        for value in values[1:]:
-            mcm = KnownProblems._mcm(mcm, value)
+            return numpy.lcm.reduce(rows, axis=1)
 
-        return mcm
+        # Every row is checked as it's reached, so the rows can be given by a generator too
+        return [KnownProblems.mcm(row) for row in rows]
 
     @staticmethod
     def count_integer_digits(n: int) -> int:
-        """Counts the number of digits of an integer.
+        """Counts the number of digits of an integer. The count is estimated from the number of
+        bits, with a correction step, so it never converts the number to a string.
 
         Params
         ------
@@ -126,11 +273,24 @@ class KnownProblems:
         -------
         An integer representing the number of digits of `n`.
         """
-        return len(str(abs(n)))
+        n = abs(n)
+
+        if n < KnownProblems._POWERS_OF_TEN[-1]:
+            return bisect.bisect_right(KnownProblems._POWERS_OF_TEN, n) + 1
+
+        # Since 2^(bits - 1) <= n the estimate is at most one or two digits short
+        digits: int = (n.bit_length() - 1) * KnownProblems._LOG10_2_NUM
+        digits = digits // KnownProblems._LOG10_2_DEN + 1
+
+        while n >= 10**digits:
+            digits += 1
+
+        return digits
 
     @staticmethod
     def count_decimal_digits(n: float) -> int:
-        """Counts the number of decimal digits in a float.
+        """Counts the number of decimal digits in a float, as shown by its shortest
+        representation. Numbers in scientific notation are counted correctly too.
 
         Params
         ------
@@ -140,41 +300,446 @@ class KnownProblems:
         -------
         An integer representing the number of decimal digits of `n`.
         """
-        splitted_number: list[str] = str(abs(n)).split(".")
+        exponent: int | str = Decimal(repr(n)).as_tuple().exponent
 
-        if len(splitted_number) < 2:
+        # Infinities and NaNs have a string exponent
+        if isinstance(exponent, str):
             return 0
 
-        return len(splitted_number[1])
+        return max(0, -exponent)
+
+    @staticmethod
+    def count_integer_digits_many(values: Any) -> Any:
+        """Counts the number of digits of each of the given integers. If a NumPy integer array is
+        given the counts are calculated in a vectorized way.
+
+        Params
+        ------
+        - `values` -> The numbers to calculate the digits, or a NumPy integer array.
+
+        Returns
+        -------
+        A list of integers, or a NumPy array if one was given, representing the number of digits of
+        each value.
+
+        Raises
+        ------
+        - `ValueError` -> If a NumPy array is given but its type is not an integer one.
+        """
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            if values.dtype.kind not in "iu":
+                raise ValueError(KnownProblems._ERRORS["integer_array"])
+
+            # Comparing with the powers of ten keeps the counts exact, unlike log10
+            powers = numpy.array(KnownProblems._POWERS_OF_TEN, dtype=numpy.uint64)
+            magnitudes = values.astype(numpy.uint64)
+            if values.dtype.kind == "i":
+                # |v| = ~v + 1 for negative values, which can't overflow even for the minimum
+                signed = values.astype(numpy.int64)
+                magnitudes = numpy.where(
+                    signed < 0, (~signed).astype(numpy.uint64) + 1, magnitudes
+                )
+
+            return numpy.searchsorted(powers, magnitudes, side="right") + 1
+
+        return list(map(KnownProblems.count_integer_digits, values))
 
     @staticmethod
-    def sieve_of_eratosthenes(n: int) -> list[int]:
-        """Finds the prime numbers from 2 to `n` using the Sieve of Eratosthenes algorithm. This
-        algorithm greatly decreases in speed the more we increase `n`, but it's still the simplest
-        way of finding prime numbers.
+    def count_decimal_digits_many(values: Any) -> Any:
+        """Counts the number of decimal digits of each of the given floats.
+
+        Params
+        ------
+        - `values` -> The numbers to calculate the decimal digits, or a NumPy float array.
+
+        Returns
+        -------
+        A list of integers, or a NumPy array if one was given, representing the number of decimal
+        digits of each value.
+        """
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            return numpy.fromiter(
+                map(KnownProblems.count_decimal_digits, values.ravel().tolist()),
+                dtype=numpy.int64,
+                count=values.size,
+            ).reshape(values.shape)
+
+        return list(map(KnownProblems.count_decimal_digits, values))
+
+    @staticmethod
+    def _small_primes(limit: int) -> list[int]:
+        """Finds the prime numbers from 2 to `limit` with a plain, non segmented, odd only sieve.
+        It's meant to be used for the base primes of the segmented sieve, so `limit` is expected
+        to be small.
+
+        Params
+        ------
+        - `limit` -> The limit of the sieve where to search for prime numbers.
+
+        Returns
+        -------
+        A list of integers representing the prime numbers from 2 to `limit`.
+        """
+        if limit < 2:
+            return []
+
+        # The i-th element represents the odd number 2 * i + 1
+        sieve: bytearray = bytearray(b"\x01") * ((limit + 1) // 2)
+        sieve[0] = 0
+
+        for i in range(1, (math.isqrt(limit) + 1) // 2):
+            if sieve[i]:
+                prime: int = 2 * i + 1
+                first: int = prime * prime // 2
+                sieve[first::prime] = bytes(len(range(first, len(sieve), prime)))
+
+        primes: list[int] = [2]
+        primes.extend(itertools.compress(range(1, limit + 1, 2), sieve))
+
+        return primes
+
+    @staticmethod
+    def _sieve_segment(low: int, high: int, base_primes: list[int]) -> list[int]:
+        """Finds the odd prime numbers from `low` to `high`, both included, crossing out the
+        multiples of the given base primes. The segment only stores the odd numbers, one byte each.
+
+        Params
+        ------
+        - `low` -> The lower bound of the segment.
+        - `high` -> The upper bound of the segment.
+        - `base_primes` -> The prime numbers up to, at least, the square root of `high`.
+
+        Returns
+        -------
+        A list of integers representing the odd prime numbers from `low` to `high`.
+        """
+        low = max(low, 3) | 1
+
+        if high < low:
+            return []
+
+        size: int = (high - low) // 2 + 1
+        segment: bytearray = bytearray(b"\x01") * size
+
+        for prime in base_primes:
+            if prime == 2:
+                continue
+
+            square: int = prime * prime
+            if square > high:
+                break
+
+            start: int = max(square, (low + prime - 1) // prime * prime)
+            if start % 2 == 0:
+                start += prime
+
+            first: int = (start - low) // 2
+            segment[first::prime] = bytes(len(range(first, size, prime)))
+
+        return list(itertools.compress(range(low, high + 1, 2), segment))
+
+    @staticmethod
+    def _init_sieve_worker(base_primes: list[int]) -> None:
+        """Stores, once per worker process, the base primes shared by all the sieve tasks.
+
+        Params
+        ------
+        - `base_primes` -> The base primes of the parallel sieve.
+        """
+        KnownProblems._worker_base_primes = base_primes
+
+    @staticmethod
+    def _sieve_task(low: int, high: int) -> list[int]:
+        """Sieves, inside a worker process, the odd prime numbers from `low` to `high`, one cache
+        sized segment at a time, with the base primes given to the worker.
+
+        Params
+        ------
+        - `low` -> The lower bound of the task.
+        - `high` -> The upper bound of the task.
+
+        Returns
+        -------
+        A list of integers representing the odd prime numbers from `low` to `high`.
+        """
+        primes: list[int] = []
+        span: int = 2 * KnownProblems._SEGMENT_SIZE
+
+        for segment_low in range(low, high + 1, span):
+            segment_high: int = min(segment_low + span - 1, high)
+            primes.extend(
+                KnownProblems._sieve_segment(
+                    segment_low, segment_high, KnownProblems._worker_base_primes
+                )
+            )
+
+        return primes
+
+    @staticmethod
+    def _iter_segments(
+        low: int, high: int, processes: int | None = 1
+    ) -> Iterator[list[int]]:
+        """Sieves the odd prime numbers from `low` to `high` one segment at a time, sharing the
+        same base primes between all the segments. With more than one process the segments are
+        sieved by a pool of workers, that receive the base primes only once, and are still given
+        back in order, only a few at a time.
+
+        Params
+        ------
+        - `low` -> The lower bound of the sieve.
+        - `high` -> The upper bound of the sieve.
+        - `processes` -> The number of worker processes, None to use all the CPUs, default: 1.
+
+        Returns
+        -------
+        An iterator over the lists of odd prime numbers found in each segment, in order.
+        """
+        base_primes: list[int] = KnownProblems._small_primes(math.isqrt(high))
+
+        if processes is not None and processes <= 1:
+            span: int = 2 * KnownProblems._SEGMENT_SIZE
+
+            for segment_low in range(max(low, 3), high + 1, span):
+                segment_high: int = min(segment_low + span - 1, high)
+                yield KnownProblems._sieve_segment(
+                    segment_low, segment_high, base_primes
+                )
+
+            return
+
+        span = 2 * KnownProblems._PARALLEL_SEGMENT_SIZE
+        processes = processes or os.cpu_count() or 1
+        # Only a couple of tasks per worker are submitted ahead, so memory stays bounded
+        window: int = 2 * processes
+
+        with ProcessPoolExecutor(
+            processes,
+            initializer=KnownProblems._init_sieve_worker,
+            initargs=(base_primes,),
+        ) as executor:
+            pending: deque[Future] = deque()
+
+            try:
+                for segment_low in range(max(low, 3), high + 1, span):
+                    segment_high = min(segment_low + span - 1, high)
+                    pending.append(
+                        executor.submit(
+                            KnownProblems._sieve_task, segment_low, segment_high
+                        )
+                    )
+
+                    if len(pending) >= window:
+                        yield pending.popleft().result()
+
+                while pending:
+                    yield pending.popleft().result()
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    @staticmethod
+    def sieve_of_eratosthenes(
+        n: int, low: int = 2, processes: int | None = 1
+    ) -> list[int]:
+        """Finds the prime numbers from `low` to `n` using the Sieve of Eratosthenes algorithm. The
+        sieve only keeps track of the odd numbers and works on segments small enough to fit in the
+        CPU cache, so neither time nor memory blow up for big values of `n`. Giving a `low` bound
+        sieves only the window from `low` to `n`, without allocating anything below it.
+
+        For very big values of `n` the segments can be sieved in parallel by more processes, the
+        result doesn't depend on their number.
 
         Params
         ------
         - `n` -> The limit of the sieve where to search for prime numbers.
+        - `low` -> The lower bound of the sieve, default: 2.
+        - `processes` -> The number of worker processes, None to use all the CPUs, default: 1.
 
         Returns
         -------
-        A list of integers representing the prime numbers frm 2 to `n`.
+        A list of integers representing the prime numbers from `low` to `n`.
         """
         primes: list[int] = []
-        sieve: set[int] = set(range(2, n + 1))
 
-        while sieve:
-            prime = min(sieve)
-            primes.append(prime)
-            sieve -= set(range(prime, n + 1, prime))
+        for segment in KnownProblems._iter_sieve_of_eratosthenes(n, low, processes):
+            primes.extend(segment)
 
         return primes
 
+    @staticmethod
+    def _iter_sieve_of_eratosthenes(
+        n: int, low: int, processes: int | None
+    ) -> Iterator[list[int]]:
+        """Finds the prime numbers from `low` to `n`, as `sieve_of_eratosthenes(...)`, but gives
+        them back one segment at a time.
+
+        Params
+        ------
+        - `n` -> The limit of the sieve where to search for prime numbers.
+        - `low` -> The lower bound of the sieve.
+        - `processes` -> The number of worker processes, None to use all the CPUs.
+
+        Returns
+        -------
+        An iterator over the lists of prime numbers found in each segment, in order.
+        """
+        if n < 2 or low > n:
+            return
+
+        if low <= 2:
+            yield [2]
+
+        yield from KnownProblems._iter_segments(low, n, processes)
+
+    @staticmethod
+    def iter_sieve_of_eratosthenes(
+        n: int, low: int = 2, processes: int | None = 1
+    ) -> Iterator[int]:
+        """Lazily generates the prime numbers from `low` to `n`, in order, with the same segmented
+        and optionally parallel sieve of `sieve_of_eratosthenes(...)`. Only a few segments are kept
+        in memory at any given time.
+
+        Params
+        ------
+        - `n` -> The limit of the sieve where to search for prime numbers.
+        - `low` -> The lower bound of the sieve, default: 2.
+        - `processes` -> The number of worker processes, None to use all the CPUs, default: 1.
+
+        Returns
+        -------
+        An iterator over the prime numbers from `low` to `n`.
+        """
+        for segment in KnownProblems._iter_sieve_of_eratosthenes(n, low, processes):
+            yield from segment
+
+    @staticmethod
+    def iter_primes(start: int = 2) -> Iterator[int]:
+        """Lazily generates the prime numbers greater or equal to `start`, without an upper limit.
+        The primes are sieved one segment at a time, only when the previous ones have all been
+        consumed, so memory stays bounded by the segment size and the base primes no matter how far
+        the iteration goes.
+
+        Params
+        ------
+        - `start` -> The number from which to start searching for prime numbers, default: 2.
+
+        Returns
+        -------
+        An iterator over the prime numbers from `start` onwards.
+        """
+        if start <= 2:
+            yield 2
+
+        span: int = 2 * KnownProblems._SEGMENT_SIZE
+        segment_low: int = max(start, 3)
+        base_limit: int = 0
+        base_primes: list[int] = []
+
+        while True:
+            segment_high: int = segment_low + span - 1
+
+            if math.isqrt(segment_high) > base_limit:
+                # Doubling the limit keeps the base primes re-sieving amortized
+                base_limit = max(2 * base_limit, math.isqrt(segment_high))
+                base_primes = KnownProblems._small_primes(base_limit)
+
+            yield from KnownProblems._sieve_segment(
+                segment_low, segment_high, base_primes
+            )
+
+            segment_low = segment_high + 1
+
+    @staticmethod
+    def _atkin_python(limit: int) -> bytearray:
+        """Toggles the candidates of the Sieve of Atkin in pure python. For every x the quadratic
+        forms are computed once, y only goes over the values of the right parity for the form's
+        remainder and the loop stops as soon as n exceeds the limit.
+
+        Params
+        ------
+        - `limit` -> The limit of the sieve.
+
+        Returns
+        -------
+        A bytearray where the i-th element is 1 if i is a candidate prime, 0 otherwise.
+        """
+        sieve: bytearray = bytearray(limit + 1)
+
+        # 4x^2 + y^2 with n % 12 in (1, 5), this needs y to be odd
+        for x in range(1, math.isqrt(limit // 4) + 1):
+            base: int = 4 * x * x
+            for y in range(1, math.isqrt(limit - base) + 1, 2):
+                n: int = base + y * y
+                if n % 12 in (1, 5):
+                    sieve[n] ^= 1
+
+        # 3x^2 + y^2 with n % 12 == 7, this needs x to be odd and y to be even
+        for x in range(1, math.isqrt(limit // 3) + 1, 2):
+            base = 3 * x * x
+            for y in range(2, math.isqrt(limit - base) + 1, 2):
+                n = base + y * y
+                if n % 12 == 7:
+                    sieve[n] ^= 1
+
+        # 3x^2 - y^2 with x > y and n % 12 == 11, this needs x + y to be odd
+        for x in range(2, limit + 1):
+            base = 3 * x * x
+            if base - (x - 1) ** 2 > limit:
+                break
+
+            for y in range(x - 1, 0, -2):
+                n = base - y * y
+                if n > limit:
+                    break
+
+                if n % 12 == 11:
+                    sieve[n] ^= 1
+
+        return sieve
+
+    @staticmethod
+    def _atkin_numpy(limit: int) -> bytearray:
+        """Toggles the candidates of the Sieve of Atkin using NumPy, vectorizing over y the same
+        quadratic forms of `_atkin_python(...)`.
+
+        Params
+        ------
+        - `limit` -> The limit of the sieve.
+
+        Returns
+        -------
+        A bytearray where the i-th element is 1 if i is a candidate prime, 0 otherwise.
+        """
+        sieve = numpy.zeros(limit + 1, dtype=numpy.uint8)
+
+        for x in range(1, math.isqrt(limit // 4) + 1):
+            n = 4 * x * x + numpy.arange(1, math.isqrt(limit - 4 * x * x) + 1, 2) ** 2
+            n = n[(n % 12 == 1) | (n % 12 == 5)]
+            sieve[n] ^= 1
+
+        for x in range(1, math.isqrt(limit // 3) + 1, 2):
+            n = 3 * x * x + numpy.arange(2, math.isqrt(limit - 3 * x * x) + 1, 2) ** 2
+            n = n[n % 12 == 7]
+            sieve[n] ^= 1
+
+        for x in range(2, limit + 1):
+            base: int = 3 * x * x
+            if base - (x - 1) ** 2 > limit:
+                break
+
+            n = base - numpy.arange(x - 1, 0, -2) ** 2
+            n = n[(n <= limit) & (n % 12 == 11)]
+            sieve[n] ^= 1
+
+        return bytearray(sieve.tobytes())
+
     @staticmethod
     def sieve_of_atkin(limit: int) -> list[int]:
         """Finds the prime numbers from 2 to limit. Builds on the concept of the sieve of
-        Eratosthenes but it's way faster even though the algorithm is more complex.
+        Eratosthenes but it's way faster even though the algorithm is more complex. When NumPy is
+        installed the quadratic forms are computed in a vectorized way.
+
+        Be aware that 2, 3 and 5 are always part of the result, even for limits smaller than 5.
 
         Params
         ------
@@ -183,36 +748,675 @@ class KnownProblems:
         Returns
         -------
         A list of integers representing the prime numbers frm 2 to `limit`.
+
+        Raises
+        ------
+        - `ValueError` -> If the limit is negative.
         """
+        if limit < 0:
+            raise ValueError(KnownProblems._ERRORS["negative"])
+
         primes: list[int] = [2, 3, 5]
-        sieve: list[bool] = [False] * (limit + 1)
-        constraint = int(math.sqrt(limit)) + 1
-
-        for x in range(1, constraint):
-            for y in range(1, constraint):
-                n = 4 * x**2 + y**2
-                r = n % 12
-                if n <= limit and r in (1, 5):
-                    sieve[n] = not sieve[n]
-
-                n = 3 * x**2 + y**2
-                r = n % 12
-                if n <= limit and r == 7:
-                    sieve[n] = not sieve[n]
-
-                n = 3 * x**2 - y**2
-                r = n % 12
-                if x > y and n <= limit and r == 11:
-                    sieve[n] = not sieve[n]
-
-        constraint -= 1
-        for x in range(5, constraint):
+
+        if numpy is not None:
+            sieve: bytearray = KnownProblems._atkin_numpy(limit)
+        else:
+            sieve = KnownProblems._atkin_python(limit)
+
+        for x in range(5, math.isqrt(limit) + 1):
             if sieve[x]:
-                for y in range(x**2, limit + 1, x**2):
-                    sieve[y] = False
+                square: int = x * x
+                sieve[square::square] = bytes(len(range(square, limit + 1, square)))
 
-        for i in range(7, limit + 1):
-            if sieve[i]:
-                primes.append(i)
+        primes.extend(itertools.compress(range(7, limit + 1), sieve[7:]))
 
         return primes
+
+    @staticmethod
+    def _grow_prime_cache(limit: int) -> None:
+        """Extends the prime cache up to, at least, `limit`, sieving only the numbers that are not
+        already in it. The caller must hold the cache lock.
+
+        Params
+        ------
+        - `limit` -> The new limit of the prime cache.
+        """
+        old_limit: int = KnownProblems._prime_table_limit
+        # Every byte of the table covers 16 numbers, so the limit is rounded to a multiple of it
+        new_limit: int = limit | 15
+
+        table: bytearray = KnownProblems._prime_table
+        if not isinstance(table, bytearray):
+            table = bytearray(table)
+        table.extend(bytes((new_limit + 1) // 16 - len(table)))
+
+        for segment in KnownProblems._iter_segments(old_limit + 1, new_limit):
+            for prime in segment:
+                index: int = prime >> 1
+                table[index >> 3] |= 1 << (index & 7)
+
+        KnownProblems._prime_table = table
+        KnownProblems._prime_table_limit = new_limit
+
+    @staticmethod
+    def _decode_prime_table(
+        table: bytearray | memoryview, low: int, high: int
+    ) -> Iterator[int]:
+        """Decodes the odd prime numbers from `low` to `high` stored in the given bit table.
+
+        Params
+        ------
+        - `table` -> The bit table to decode.
+        - `low` -> The lower bound of the numbers to decode.
+        - `high` -> The upper bound of the numbers to decode.
+
+        Returns
+        -------
+        An iterator over the odd prime numbers from `low` to `high`.
+        """
+        first: int = max(low, 3) // 2
+        last: int = (high - 1) // 2
+
+        if last < first:
+            return iter(())
+
+        offset: int = (first >> 3) << 3
+        expanded: bytes = b"".join(
+            map(
+                KnownProblems._BITS_TO_BYTES.__getitem__,
+                table[first >> 3 : (last >> 3) + 1],
+            )
+        )
+
+        return itertools.compress(
+            range(2 * first + 1, 2 * last + 2, 2),
+            expanded[first - offset : last - offset + 1],
+        )
+
+    @staticmethod
+    def cached_primes(limit: int, low: int = 2) -> list[int]:
+        """Finds the prime numbers from `low` to `limit` using a prime cache shared by the whole
+        process. The cache only grows: asking for primes below its current limit just reads them
+        from it, while asking above it only sieves the missing range.
+
+        Params
+        ------
+        - `limit` -> The limit where to search for prime numbers.
+        - `low` -> The lower bound where to search for prime numbers, default: 2.
+
+        Returns
+        -------
+        A list of integers representing the prime numbers from `low` to `limit`.
+        """
+        primes: list[int] = []
+
+        if limit < 2 or low > limit:
+            return primes
+
+        with KnownProblems._PRIME_CACHE_LOCK:
+            if limit > KnownProblems._prime_table_limit:
+                KnownProblems._grow_prime_cache(limit)
+
+            table: bytearray | memoryview = KnownProblems._prime_table
+
+        if low <= 2:
+            primes.append(2)
+
+        primes.extend(KnownProblems._decode_prime_table(table, low, limit))
+
+        return primes
+
+    @staticmethod
+    def save_prime_cache(file_path: str, limit: int = 0) -> None:
+        """Saves the prime cache to a file, bit-packed, so that it can be shared with other
+        processes through `load_prime_cache(...)`. If `limit` is greater than the current limit of
+        the cache it will be grown before saving. The cache is written to a temporary file that
+        replaces the given one only once it's complete, so processes that have the old file
+        memory-mapped keep using it unchanged.
+
+        Params
+        ------
+        - `file_path` -> The file path where to save the prime cache.
+        - `limit` -> The minimum limit of the saved cache, default: 0.
+        """
+        with KnownProblems._PRIME_CACHE_LOCK:
+            if limit > KnownProblems._prime_table_limit:
+                KnownProblems._grow_prime_cache(limit)
+
+            directory, name = os.path.split(file_path)
+            temp_path: str = os.path.join(directory, f".{name}.{uuid.uuid4().hex}.tmp")
+
+            try:
+                with open(temp_path, "wb") as f:
+                    f.write(
+                        KnownProblems._PRIME_CACHE_HEADER.pack(
+                            KnownProblems._PRIME_CACHE_MAGIC,
+                            KnownProblems._prime_table_limit,
+                        )
+                    )
+                    f.write(KnownProblems._prime_table)
+
+                os.replace(temp_path, file_path)
+            finally:
+                if os.path.isfile(temp_path):
+                    os.remove(temp_path)
+
+    @staticmethod
+    def load_prime_cache(file_path: str) -> None:
+        """Loads a prime cache saved by `save_prime_cache(...)`. The file is memory-mapped
+        read-only, so every process loading it shares the same pages without copying them. Since
+        the cache only grows, the file is ignored if its limit is smaller than the current one.
+
+        Params
+        ------
+        - `file_path` -> The file path where to find the prime cache.
+
+        Raises
+        ------
+        - `ValueError` -> If the file is not a valid prime cache.
+        """
+        header: struct.Struct = KnownProblems._PRIME_CACHE_HEADER
+
+        with open(file_path, "rb") as f:
+            mapped: mmap.mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(mapped) < header.size:
+            raise ValueError(KnownProblems._ERRORS["cache_file"] % file_path)
+
+        magic, limit = header.unpack_from(mapped)
+        if magic != KnownProblems._PRIME_CACHE_MAGIC or (
+            len(mapped) - header.size != (limit + 1) // 16
+        ):
+            raise ValueError(KnownProblems._ERRORS["cache_file"] % file_path)
+
+        with KnownProblems._PRIME_CACHE_LOCK:
+            if limit > KnownProblems._prime_table_limit:
+                KnownProblems._prime_table = memoryview(mapped)[header.size :]
+                KnownProblems._prime_table_limit = limit
+
+    @staticmethod
+    def clear_prime_cache() -> None:
+        """Empties the prime cache, releasing its memory or its memory-mapped file."""
+        with KnownProblems._PRIME_CACHE_LOCK:
+            KnownProblems._prime_table = bytearray()
+            KnownProblems._prime_table_limit = 0
+
+    @staticmethod
+    def _get_trial_primes() -> list[int]:
+        """Gets the small prime numbers used for trial division, sieving them the first time.
+
+        Returns
+        -------
+        A list of integers representing the prime numbers used for trial division.
+        """
+        if not KnownProblems._trial_primes:
+            KnownProblems._trial_primes = KnownProblems._small_primes(
+                KnownProblems._TRIAL_DIVISION_LIMIT
+            )
+
+        return KnownProblems._trial_primes
+
+    @staticmethod
+    def _in_prime_table(n: int, table: bytearray | memoryview) -> bool:
+        """Checks if a number is prime looking it up in a prime cache table. The number must be
+        greater than 1 and within the table limit.
+
+        Params
+        ------
+        - `n` -> The number to check.
+        - `table` -> The prime cache table where to look the number up.
+
+        Returns
+        -------
+        A bool representing whether `n` is prime or not.
+        """
+        if n & 1 == 0:
+            return n == 2
+
+        return bool(table[n >> 4] >> ((n >> 1) & 7) & 1)
+
+    @staticmethod
+    def _miller_rabin(n: int) -> bool:
+        """Runs the Miller-Rabin test on an odd number greater than the squares of the trial
+        primes, with a set of bases that makes it deterministic for all the numbers below 3.3e24.
+
+        Params
+        ------
+        - `n` -> The number to test.
+
+        Returns
+        -------
+        A bool representing whether `n` is prime or not.
+        """
+        d: int = n - 1
+        s: int = (d & -d).bit_length() - 1
+        d >>= s
+
+        for base in KnownProblems._MILLER_RABIN_BASES:
+            x: int = pow(base, d, n)
+            if x in (1, n - 1):
+                continue
+
+            for _ in range(s - 1):
+                x = x * x % n
+                if x == n - 1:
+                    break
+            else:
+                return False
+
+        return True
+
+    @staticmethod
+    def _check_prime(n: int, table: bytearray | memoryview, limit: int) -> bool:
+        """Checks if a number is prime using, in order, the given prime cache table, trial division
+        by the small primes and the Miller-Rabin test.
+
+        Params
+        ------
+        - `n` -> The number to check.
+        - `table` -> The prime cache table.
+        - `limit` -> The limit of the prime cache table.
+
+        Returns
+        -------
+        A bool representing whether `n` is prime or not.
+        """
+        if n < 2:
+            return False
+
+        if n <= limit:
+            return KnownProblems._in_prime_table(n, table)
+
+        for prime in KnownProblems._get_trial_primes():
+            if n % prime == 0:
+                return n == prime
+
+        if n < KnownProblems._TRIAL_DIVISION_LIMIT**2:
+            return True
+
+        return KnownProblems._miller_rabin(n)
+
+    @staticmethod
+    def is_prime(n: int) -> bool:
+        """Checks if a number is prime. Numbers inside the prime cache are simply looked up, the
+        others go through trial division by the small primes and then a Miller-Rabin test, which is
+        deterministic for every 64 bit integer, and beyond up to 3.3e24.
+
+        Params
+        ------
+        - `n` -> The number to check.
+
+        Returns
+        -------
+        A bool representing whether `n` is prime or not.
+        """
+        # The table and its limit are replaced together, so they must be read together too
+        with KnownProblems._PRIME_CACHE_LOCK:
+            table: bytearray | memoryview = KnownProblems._prime_table
+            limit: int = KnownProblems._prime_table_limit
+
+        return KnownProblems._check_prime(n, table, limit)
+
+    @staticmethod
+    def is_prime_many(numbers: Iterable[int]) -> list[bool]:
+        """Checks if each of the given numbers is prime. Compared to calling `is_prime(...)` on
+        each of them, the prime cache is first grown up to the biggest number, when that's not too
+        big, so most of the checks become simple look ups.
+
+        Params
+        ------
+        - `numbers` -> The numbers to check.
+
+        Returns
+        -------
+        A list of bools, where each one represents whether the corresponding number is prime or
+        not.
+        """
+        numbers = list(numbers)
+
+        if not numbers:
+            return []
+
+        biggest: int = min(max(numbers), KnownProblems._BATCH_SIEVE_LIMIT)
+        with KnownProblems._PRIME_CACHE_LOCK:
+            if biggest > KnownProblems._prime_table_limit:
+                KnownProblems._grow_prime_cache(biggest)
+
+            table: bytearray | memoryview = KnownProblems._prime_table
+            limit: int = KnownProblems._prime_table_limit
+
+        return [KnownProblems._check_prime(n, table, limit) for n in numbers]
+
+    @staticmethod
+    def _icbrt(n: int) -> int:
+        """Calculates the integer cube root of a non negative integer.
+
+        Params
+        ------
+        - `n` -> The number to calculate the cube root.
+
+        Returns
+        -------
+        The biggest integer whose cube is not greater than `n`.
+        """
+        root: int = round(n ** (1 / 3))
+
+        while root**3 > n:
+            root -= 1
+        while (root + 1) ** 3 <= n:
+            root += 1
+
+        return root
+
+    @staticmethod
+    def _get_phi_tables() -> list[tuple[int, int, list[int]]]:
+        """Gets the tables of the phi function of the first few primes, building them the first
+        time.
+
+        Returns
+        -------
+        A list where the a-th element has the period of the phi function of the first `a` primes,
+        its value at the period and its values from 0 to the period excluded.
+        """
+        if not KnownProblems._phi_tables:
+            tables: list[tuple[int, int, list[int]]] = []
+            period: int = 1
+            count: int = 1
+
+            for a in range(len(KnownProblems._PHI_TABLE_PRIMES) + 1):
+                coprimes: Iterator[int] = (
+                    int(math.gcd(i, period) == 1) for i in range(1, period)
+                )
+                tables.append((period, count, [0, *itertools.accumulate(coprimes)]))
+
+                if a < len(KnownProblems._PHI_TABLE_PRIMES):
+                    period *= KnownProblems._PHI_TABLE_PRIMES[a]
+                    count *= KnownProblems._PHI_TABLE_PRIMES[a] - 1
+
+            KnownProblems._phi_tables = tables
+
+        return KnownProblems._phi_tables
+
+    @staticmethod
+    def _phi(
+        x: int, a: int, primes: list[int], memo: dict[tuple[int, int], int]
+    ) -> int:
+        """Counts the integers from 1 to `x` not divisible by any of the first `a` primes, the
+        Legendre's phi function.
+
+        Params
+        ------
+        - `x` -> The upper bound of the integers to count.
+        - `a` -> The number of primes to exclude the multiples of.
+        - `primes` -> The prime numbers up to, at least, the square root of `x`.
+        - `memo` -> The already calculated values of the function.
+
+        Returns
+        -------
+        An integer representing the value of the phi function.
+        """
+        tables: list[tuple[int, int, list[int]]] = KnownProblems._get_phi_tables()
+        if a < len(tables):
+            period, count, rests = tables[a]
+            return x // period * count + rests[x % period]
+
+        if primes[a - 1] >= x:
+            return 1
+
+        if a < len(primes) and primes[a] * primes[a] > x:
+            # Only 1 and the primes between the a-th one and x are left
+            return 1 + bisect.bisect_right(primes, x) - a
+
+        key: tuple[int, int] = (x, a)
+        if key not in memo:
+            # phi(x, a) = phi(x, a - 1) - phi(x / p_a, a - 1) unrolled down to the tables, so the
+            # recursion is only as deep as the times x can be divided, not a
+            count = KnownProblems._phi(x, len(tables) - 1, primes, memo)
+            for i in range(len(tables) - 1, a):
+                count -= KnownProblems._phi(x // primes[i], i, primes, memo)
+
+            memo[key] = count
+
+        return memo[key]
+
+    @staticmethod
+    def _lehmer(
+        x: int, primes: list[int], limit: int, memo: dict[tuple[int, int], int]
+    ) -> int:
+        """Counts the prime numbers from 2 to `x` with the Lehmer's formula.
+
+        Params
+        ------
+        - `x` -> The upper bound of the primes to count.
+        - `primes` -> The prime numbers from 2 to `limit`.
+        - `limit` -> The limit of the given primes, at least the square root of `x`.
+        - `memo` -> The memo for the phi function.
+
+        Returns
+        -------
+        An integer representing the number of primes from 2 to `x`.
+        """
+        if x <= limit:
+            return bisect.bisect_right(primes, x)
+
+        a: int = bisect.bisect_right(primes, math.isqrt(math.isqrt(x)))
+        b: int = bisect.bisect_right(primes, math.isqrt(x))
+        c: int = bisect.bisect_right(primes, KnownProblems._icbrt(x))
+
+        count: int = KnownProblems._phi(x, a, primes, memo)
+        count += (b + a - 2) * (b - a + 1) // 2
+
+        for i in range(a, b):
+            w: int = x // primes[i]
+            count -= KnownProblems._lehmer(w, primes, limit, memo)
+
+            if i < c:
+                last: int = bisect.bisect_right(primes, math.isqrt(w))
+                for j in range(i, last):
+                    count -= (
+                        KnownProblems._lehmer(w // primes[j], primes, limit, memo) - j
+                    )
+
+        return count
+
+    @staticmethod
+    def prime_count(n: int) -> int:
+        """Counts the prime numbers from 2 to `n` with the Meissel-Lehmer method, without building
+        the list of all of them. Only the primes up to about n^(2/3) are sieved, through the prime
+        cache.
+
+        Params
+        ------
+        - `n` -> The limit where to count the prime numbers.
+
+        Returns
+        -------
+        An integer representing the number of prime numbers from 2 to `n`.
+        """
+        if n < 2:
+            return 0
+
+        cube_root: int = KnownProblems._icbrt(n)
+        limit: int = max(
+            math.isqrt(n), min(cube_root * cube_root, KnownProblems._BATCH_SIEVE_LIMIT)
+        )
+        primes: list[int] = KnownProblems.cached_primes(limit)
+
+        return KnownProblems._lehmer(n, primes, limit, {})
+
+    @staticmethod
+    def smallest_prime_factors(limit: int) -> array.array:
+        """Builds the table of the smallest prime factor of every integer from 0 to `limit`, where
+        0 and 1 are mapped to themselves. With it every integer up to `limit` can be factorized in
+        O(log n) steps, see `factorize(...)`.
+
+        Params
+        ------
+        - `limit` -> The limit of the table, at most 2^32 - 1.
+
+        Returns
+        -------
+        An array of unsigned integers where the i-th element is the smallest prime factor of i.
+        """
+        table: array.array = array.array("I", range(limit + 1))
+
+        # Going from the biggest prime down, the smallest factor is the last one written
+        for prime in reversed(KnownProblems._small_primes(math.isqrt(limit))):
+            square: int = prime * prime
+            table[square::prime] = array.array("I", [prime]) * len(
+                range(square, limit + 1, prime)
+            )
+
+        return table
+
+    @staticmethod
+    def _pollard_brent(n: int) -> int:
+        """Finds a non trivial factor of an odd composite number with the Brent's variant of the
+        Pollard's rho algorithm. The polynomial constants are tried in order, so the result is
+        always the same for the same number.
+
+        Params
+        ------
+        - `n` -> The odd composite number to find a factor of.
+
+        Returns
+        -------
+        An integer representing a non trivial factor of `n`.
+        """
+        for c in itertools.count(1):
+            y: int = 2
+            r: int = 1
+            q: int = 1
+            g: int = 1
+
+            while g == 1:
+                x: int = y
+                for _ in range(r):
+                    y = (y * y + c) % n
+
+                k: int = 0
+                while k < r and g == 1:
+                    saved_y: int = y
+                    for _ in range(min(KnownProblems._RHO_BATCH, r - k)):
+                        y = (y * y + c) % n
+                        q = q * abs(x - y) % n
+                    g = math.gcd(q, n)
+                    k += KnownProblems._RHO_BATCH
+
+                r *= 2
+
+            if g == n:
+                # The batch overshot, so the steps are repeated one at a time
+                g = 1
+                while g == 1:
+                    saved_y = (saved_y * saved_y + c) % n
+                    g = math.gcd(abs(x - saved_y), n)
+
+            if g != n:
+                return g
+
+        return n
+
+    @staticmethod
+    def factorize(n: int, spf_table: array.array | None = None) -> dict[int, int]:
+        """Factorizes a positive integer. If a table built by `smallest_prime_factors(...)` is given
+        and `n` is inside it, the factors are just read from it. Otherwise the number is trial
+        divided by the small primes and the remaining cofactor is split with the Pollard-Brent rho
+        algorithm.
+
+        Params
+        ------
+        - `n` -> The number to factorize.
+        - `spf_table` -> The smallest prime factors table, default: None.
+
+        Returns
+        -------
+        A dictionary mapping each prime factor of `n`, in ascending order, to its exponent.
+
+        Raises
+        ------
+        - `ValueError` -> If `n` is not positive.
+        """
+        if n < 1:
+            raise ValueError(KnownProblems._ERRORS["factorize"])
+
+        factors: dict[int, int] = {}
+
+        if spf_table is not None and n < len(spf_table):
+            while n > 1:
+                prime: int = spf_table[n]
+                factors[prime] = factors.get(prime, 0) + 1
+                n //= prime
+
+            return factors
+
+        for prime in KnownProblems._get_trial_primes():
+            if prime * prime > n:
+                break
+
+            while n % prime == 0:
+                factors[prime] = factors.get(prime, 0) + 1
+                n //= prime
+
+        to_split: list[int] = [n] if n > 1 else []
+        while to_split:
+            m: int = to_split.pop()
+
+            if KnownProblems.is_prime(m):
+                factors[m] = factors.get(m, 0) + 1
+            else:
+                factor: int = KnownProblems._pollard_brent(m)
+                to_split.extend((factor, m // factor))
+
+        return dict(sorted(factors.items()))
+
+    @staticmethod
+    def factorize_many(values: Iterable[int]) -> list[dict[int, int]]:
+        """Factorizes all the given positive integers. A smallest prime factors table is built once,
+        up to the biggest value or a fixed cap, so that most of the values are factorized in
+        O(log n) steps.
+
+        Params
+        ------
+        - `values` -> The numbers to factorize.
+
+        Returns
+        -------
+        A list of dictionaries, one for each value, mapping its prime factors to their exponents.
+
+        Raises
+        ------
+        - `ValueError` -> If any of the values is not positive.
+        """
+        values = list(values)
+
+        if not values:
+            return []
+
+        spf_table: array.array = KnownProblems.smallest_prime_factors(
+            min(max(values), KnownProblems._BATCH_SIEVE_LIMIT)
+        )
+
+        return [KnownProblems.factorize(value, spf_table) for value in values]
+
+    @staticmethod
+    def count_divisors(n: int, spf_table: array.array | None = None) -> int:
+        """Counts the positive divisors of a positive integer from its factorization.
+
+        Params
+        ------
+        - `n` -> The number to count the divisors of.
+        - `spf_table` -> The smallest prime factors table to pass to `factorize(...)`, default:
+        None.
+
+        Returns
+        -------
+        An integer representing the number of divisors of `n`.
+
+        Raises
+        ------
+        - `ValueError` -> If `n` is not positive.
+        """
+        return math.prod(
+            exponent + 1 for exponent in KnownProblems.factorize(n, spf_table).values()
+        )
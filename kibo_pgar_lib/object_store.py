@@ -0,0 +1,298 @@
+"""Module for the ObjectStore class"""
+
+# Standard Modules
+import os
+import pickle
+import struct
+from collections.abc import Iterator
+from types import TracebackType
+from typing import IO
+
+
+class ObjectStore:
+    """
+    This class saves many objects, each one under its own key, in a single append-only data file,
+    keeping a compact index of where every object is. Loading an object only reads and unpickles
+    its own record.
+
+    The index is kept in a second file, named as the data file followed by ".index", where every
+    put or delete appends an entry. Overwritten and deleted objects keep using space in the data
+    file until `compact()` is called.
+
+    A compaction interrupted by a crash is either discarded or completed the next time the store
+    is opened, so the data file and the index always match.
+    """
+
+    _ERRORS: dict[str, str] = {
+        "key": "The key %s is not in the store.",
+        "closed": "The store is closed.",
+    }
+
+    _INDEX_SUFFIX: str = ".index"
+    # Compacted files are written with the first suffix, renaming the compacted index with the
+    # second one, once both files are complete, commits the compaction
+    _COMPACT_SUFFIX: str = ".compact"
+    _COMMITTED_SUFFIX: str = ".committed"
+    # Every index entry is the offset and length of the record, the key length and then the key
+    _INDEX_ENTRY: struct.Struct = struct.Struct("<QQI")
+    # Length marking a deleted key
+    _DELETED: int = 2**64 - 1
+
+    def __init__(self, file_path: str) -> None:
+        """Opens the store saved at the given path, creating it if it doesn't exist.
+
+        Params
+        ------
+        - `file_path` -> The file path of the data file of the store.
+        """
+        self._file_path: str = file_path
+        self._index: dict[str, tuple[int, int]] = {}
+        self._garbage: int = 0
+
+        self._recover()
+        if os.path.isfile(self._index_path()):
+            self._load_index()
+
+        # pylint: disable=consider-using-with
+        self._data: IO[bytes] = open(file_path, "a+b")
+        self._index_file: IO[bytes] = open(self._index_path(), "ab")
+
+    def __enter__(self) -> "ObjectStore":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def _index_path(self) -> str:
+        """Gets the path of the index file of this store.
+
+        Returns
+        -------
+        A string with the path of the index file.
+        """
+        return self._file_path + ObjectStore._INDEX_SUFFIX
+
+    def _recover(self) -> None:
+        """Completes a committed compaction that was interrupted, or discards an uncommitted one.
+        Every step can be repeated, so a crash while recovering is recovered the next time.
+        """
+        data_path: str = self._file_path + ObjectStore._COMPACT_SUFFIX
+        index_path: str = self._index_path() + ObjectStore._COMPACT_SUFFIX
+        committed_path: str = self._index_path() + ObjectStore._COMMITTED_SUFFIX
+
+        if os.path.isfile(committed_path):
+            # The compacted data file could have already replaced the old one
+            if os.path.isfile(data_path):
+                os.replace(data_path, self._file_path)
+            os.replace(committed_path, self._index_path())
+        else:
+            for path in (data_path, index_path):
+                if os.path.isfile(path):
+                    os.remove(path)
+
+    def _load_index(self) -> None:
+        """Reads the index file, replaying all of its entries. A truncated last entry, as left by
+        a crash, is ignored.
+        """
+        entry: struct.Struct = ObjectStore._INDEX_ENTRY
+
+        with open(self._index_path(), "rb") as f:
+            while len(header := f.read(entry.size)) == entry.size:
+                offset, length, key_length = entry.unpack(header)
+                key_bytes: bytes = f.read(key_length)
+                if len(key_bytes) < key_length:
+                    break
+
+                key: str = key_bytes.decode()
+                if key in self._index:
+                    self._garbage += self._index[key][1]
+
+                if length == ObjectStore._DELETED:
+                    self._index.pop(key, None)
+                else:
+                    self._index[key] = (offset, length)
+
+    def _write_index_entry(self, key: str, offset: int, length: int) -> None:
+        """Appends an entry to the index file.
+
+        Params
+        ------
+        - `key` -> The key of the entry.
+        - `offset` -> The offset of the record in the data file.
+        - `length` -> The length of the record, or the deleted marker.
+        """
+        key_bytes: bytes = key.encode()
+
+        self._index_file.write(
+            ObjectStore._INDEX_ENTRY.pack(offset, length, len(key_bytes))
+        )
+        self._index_file.write(key_bytes)
+
+    def _check_open(self) -> None:
+        """Checks that this store is still open.
+
+        Raises
+        ------
+        - `ValueError` -> If the store has been closed.
+        """
+        if self._data.closed:
+            raise ValueError(ObjectStore._ERRORS["closed"])
+
+    @property
+    def garbage_bytes(self) -> int:
+        """Gets the number of bytes of the data file used by overwritten or deleted objects.
+
+        Returns
+        -------
+        An integer representing the bytes that `compact()` would reclaim.
+        """
+        return self._garbage
+
+    def put(self, key: str, obj: object) -> None:
+        """Saves an object under the given key, replacing any object already saved under it.
+
+        Params
+        ------
+        - `key` -> The key of the object.
+        - `obj` -> The object to save.
+
+        Raises
+        ------
+        - `ValueError` -> If the store has been closed.
+        """
+        self._check_open()
+
+        record: bytes = pickle.dumps(obj)
+        offset: int = self._data.seek(0, os.SEEK_END)
+        self._data.write(record)
+
+        if key in self._index:
+            self._garbage += self._index[key][1]
+        self._index[key] = (offset, len(record))
+        self._write_index_entry(key, offset, len(record))
+
+    def get(self, key: str) -> object:
+        """Loads the object saved under the given key, reading only its record.
+
+        Params
+        ------
+        - `key` -> The key of the object.
+
+        Returns
+        -------
+        The loaded object.
+
+        Raises
+        ------
+        - `KeyError` -> If there's no object saved under the key.
+        - `ValueError` -> If the store has been closed.
+        """
+        self._check_open()
+
+        if key not in self._index:
+            raise KeyError(ObjectStore._ERRORS["key"] % key)
+
+        offset, length = self._index[key]
+        self._data.seek(offset)
+
+        return pickle.loads(self._data.read(length))
+
+    def delete(self, key: str) -> None:
+        """Deletes the object saved under the given key.
+
+        Params
+        ------
+        - `key` -> The key of the object.
+
+        Raises
+        ------
+        - `KeyError` -> If there's no object saved under the key.
+        - `ValueError` -> If the store has been closed.
+        """
+        self._check_open()
+
+        if key not in self._index:
+            raise KeyError(ObjectStore._ERRORS["key"] % key)
+
+        self._garbage += self._index.pop(key)[1]
+        self._write_index_entry(key, 0, ObjectStore._DELETED)
+
+    def keys(self) -> Iterator[str]:
+        """Gets the keys of all the objects in this store.
+
+        Returns
+        -------
+        An iterator over the keys, in the order they were first saved.
+        """
+        return iter(list(self._index))
+
+    def flush(self) -> None:
+        """Writes to disk everything that's still buffered."""
+        self._check_open()
+
+        self._data.flush()
+        self._index_file.flush()
+
+    def compact(self) -> None:
+        """Rewrites the data and index files with only the current objects, reclaiming the space
+        used by overwritten and deleted ones. The new files are written and forced on disk next to
+        the old ones, then committed with a single rename of the new index, and only then they
+        replace the old files. If this is interrupted, opening the store again either discards the
+        new files, when they weren't committed yet, or finishes replacing the old ones.
+
+        Raises
+        ------
+        - `ValueError` -> If the store has been closed.
+        """
+        self.flush()
+
+        data_path: str = self._file_path + ObjectStore._COMPACT_SUFFIX
+        index_path: str = self._index_path() + ObjectStore._COMPACT_SUFFIX
+        committed_path: str = self._index_path() + ObjectStore._COMMITTED_SUFFIX
+        index: dict[str, tuple[int, int]] = {}
+
+        with open(data_path, "wb") as data, open(index_path, "wb") as index_file:
+            for key, (offset, length) in self._index.items():
+                self._data.seek(offset)
+                index[key] = (data.tell(), length)
+                data.write(self._data.read(length))
+
+                key_bytes: bytes = key.encode()
+                index_file.write(
+                    ObjectStore._INDEX_ENTRY.pack(*index[key], len(key_bytes))
+                )
+                index_file.write(key_bytes)
+
+            for f in (data, index_file):
+                f.flush()
+                os.fsync(f.fileno())
+
+        os.replace(index_path, committed_path)
+
+        self._data.close()
+        self._index_file.close()
+        os.replace(data_path, self._file_path)
+        os.replace(committed_path, self._index_path())
+
+        # pylint: disable=consider-using-with
+        self._data = open(self._file_path, "a+b")
+        self._index_file = open(self._index_path(), "ab")
+        self._index = index
+        self._garbage = 0
+
+    def close(self) -> None:
+        """Flushes and closes the files of this store."""
+        if not self._data.closed:
+            self._data.close()
+            self._index_file.close()
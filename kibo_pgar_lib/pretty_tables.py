@@ -6,8 +6,10 @@ This module provides:
 """
 
 # Standard Modules
+import itertools
+from collections.abc import Iterator
 from enum import IntEnum
-from typing import Any
+from typing import Any, TextIO
 
 # Internal Modules
 from kibo_pgar_lib.ansi_colors import AnsiFontColors, AnsiFontWeights
@@ -22,7 +24,7 @@ class Alignment(IntEnum):
     RIGHT: int = 1
 
 
-class CommandLineTable:
+class CommandLineTable:  # pylint: disable=too-many-instance-attributes
     """Class to handle the visualization of a table in a terminal."""
 
     _RED_ERROR: str = PrettyStrings.prettify(
@@ -33,6 +35,7 @@ class CommandLineTable:
     _SET_ROWS_EXCEPTION: str = (
         "All the rows must be lists of the same length as of the headers."
     )
+    _WIDTHS_EXCEPTION: str = "The widths must be as many as the headers."
 
     _HORIZONTAL_SEPARATOR: str = "-"
     _VERTICAL_SEPARATOR: str = "|"
@@ -46,8 +49,24 @@ class CommandLineTable:
         - `cell_alignment` -> The cell alignment given from the Alignment enum, default: LEFT.
         - `headers` -> The list of headers, default: empty list
         - `rows` -> The rows of the table, default: empty bi-dimensional list
+        - `cached_widths` -> If the widths of the columns, kept up to date by the methods of this
+        class, should be used instead of measuring all the cells every time the table is printed,
+        default: False.
+
+        Cached widths save a scan of every cell when a huge table is printed, but they are only
+        right as long as the headers and the rows are changed through the attributes and the
+        methods of this class. A cell edited in place, like `table.rows[0][0] = "..."`, is not
+        noticed and would be cut off.
         """
+        # The widest cell of each column and how many cells are that wide, so a cell getting
+        # shorter only needs its column measured again when it was the last one that wide
+        self._widths: list[int] = []
+        self._width_counts: list[int] = []
+        # The number of headers and rows when the widths were last updated
+        self._measured_shape: tuple[int, int] = (0, 0)
+
         self.show_vlines: bool = False
+        self.cached_widths: bool = False
         self.cell_alignment: Alignment = Alignment.LEFT
         self.headers: list[str] = []
         self.rows: list[list[str]] = []
@@ -59,7 +78,7 @@ class CommandLineTable:
 
     def __setattr__(self, name: str, value: Any) -> None:
         match name:
-            case "show_vlines":
+            case "show_vlines" | "cached_widths":
                 value = bool(value)
 
             case "cell_alignment":
@@ -89,6 +108,18 @@ class CommandLineTable:
 
                 value = list(map(str, value))
 
+                old_headers: list[str] | None = self.__dict__.get("_headers")
+                self.__dict__["_headers"] = value
+
+                if old_headers is not None and len(old_headers) == len(value):
+                    for i, (old, new) in enumerate(zip(old_headers, value)):
+                        self._grow_width(i, len(new))
+                        self._shrink_width(i, len(old))
+                else:
+                    self._measure_widths()
+
+                return
+
             case "rows":
                 if not (
                     isinstance(value, list)
@@ -108,7 +139,74 @@ class CommandLineTable:
 
                 value = [[str(val) for val in row] for row in value]
 
-        self.__dict__[f"_{name}"] = value
+                self.__dict__["_rows"] = value
+                self._measure_widths()
+
+                return
+
+        # Private attributes are stored as they are, public ones behind their mirror
+        self.__dict__[name if name.startswith("_") else f"_{name}"] = value
+
+    def _grow_width(self, column: int, width: int) -> None:
+        """Updates the width of a column for a new cell.
+
+        Params
+        ------
+        - `column` -> The index of the column.
+        - `width` -> The width of the new cell.
+        """
+        if width > self._widths[column]:
+            self._widths[column] = width
+            self._width_counts[column] = 1
+        elif width == self._widths[column]:
+            self._width_counts[column] += 1
+
+    def _shrink_width(self, column: int, width: int) -> None:
+        """Updates the width of a column for a removed cell, measuring the column again only if
+        the cell was the last one as wide as the column.
+
+        Params
+        ------
+        - `column` -> The index of the column.
+        - `width` -> The width of the removed cell.
+        """
+        if width == self._widths[column]:
+            self._width_counts[column] -= 1
+
+            if not self._width_counts[column]:
+                self._measure_column(column)
+
+    def _measure_column(self, column: int) -> None:
+        """Measures the width of a column from all of its cells.
+
+        Params
+        ------
+        - `column` -> The index of the column.
+        """
+        widths: list[int] = [len(self.headers[column])]
+        widths.extend(len(row[column]) for row in self.rows)
+
+        self._widths[column] = max(widths)
+        self._width_counts[column] = widths.count(self._widths[column])
+
+    def _measure_widths(self) -> None:
+        """Measures the widths of all the columns from all of their cells."""
+        headers: list[str] = self.__dict__.get("_headers", [])
+        self._widths = [0] * len(headers)
+        self._width_counts = [0] * len(headers)
+
+        for row in itertools.chain([headers], self.__dict__.get("_rows", [])):
+            for i, cell in zip(range(len(headers)), row):
+                self._grow_width(i, len(cell))
+
+        self._measured_shape = (len(headers), len(self.__dict__.get("_rows", [])))
+
+    def _check_widths(self) -> None:
+        """Measures the widths of all the columns again if headers or rows were added or removed
+        from outside this class, checking only how many there are.
+        """
+        if self._measured_shape != (len(self.headers), len(self.rows)):
+            self._measure_widths()
 
     def add_headers(self, headers: list[Any]) -> None:
         """Adds the given headers, converted to string, to this table headers. Since this operation
@@ -119,12 +217,21 @@ class CommandLineTable:
         ------
         - `headers` -> The headers to add to this table headers.
         """
+        self._check_widths()
+
         headers = list(map(str, headers))
         self.headers.extend(headers)
 
         for row in self.rows:
             row.extend([""] * len(headers))
 
+        for header in headers:
+            self._widths.append(len(header))
+            # The new empty cells are as wide as the column if the header is empty too
+            self._width_counts.append(1 if header else 1 + len(self.rows))
+
+        self._measured_shape = (len(self.headers), len(self.rows))
+
     def add_rows(self, rows: list[list[Any]]) -> None:
         """Adds the given rows, converted to string, to this table rows. Remember that the length
         of every row must be equal to that of the headers!
@@ -150,8 +257,15 @@ class CommandLineTable:
                 )
             )
 
+        self._check_widths()
         self.rows.extend(rows)
 
+        for row in rows:
+            for i, cell in enumerate(row):
+                self._grow_width(i, len(cell))
+
+        self._measured_shape = (len(self.headers), len(self.rows))
+
     def fill_holes(self, fillings: list[list[Any]]):
         """Will fill all the holes left by a previous add_headers(...) call. Be aware that, as one
         can expect, if the dimension of the fillings is smaller than that of the holes, some will
@@ -201,6 +315,7 @@ class CommandLineTable:
         - `fillings` -> The bi-dimensional list with the fillings for this table
         """
         fillings = [[str(value) for value in row] for row in fillings]
+        self._check_widths()
 
         fill_i: int = 0
         for i, row in enumerate(self.rows):
@@ -213,27 +328,54 @@ class CommandLineTable:
                     and not cell
                 ):
                     self.rows[i][j] = fillings[fill_i][fill_j]
+                    self._grow_width(j, len(self.rows[i][j]))
+                    self._shrink_width(j, 0)
                     filled = True
                     fill_j += 1
 
             fill_i += 1 if filled else 0
 
-    def _get_max_width_per_column(self) -> list[int]:
+    def _get_max_width_per_column(self, sample_size: int | None = None) -> list[int]:
         """Calculates the maximum width needed to print each column. It will add 2 spaces if the
-        alignment is set to center, 1 otherwise.
+        alignment is set to center, 1 otherwise. With `cached_widths` the widths of all the rows
+        are already known, so only a sample needs to be measured.
+
+        Params
+        ------
+        - `sample_size` -> The number of rows, from the first one, to measure, None to measure all
+        of them, default: None.
 
         Returns
         -------
         A list of integers representing the widths of each column.
         """
+        if sample_size is None and self.cached_widths:
+            self._check_widths()
+
+            return self._pad_widths(self._widths)
+
         widths: list[int] = [0] * len(self.headers)
-        table: list[list[str]] = [self.headers]
-        table.extend(self.rows)
 
-        for row in table:
+        for row in itertools.chain(
+            [self.headers], itertools.islice(self.rows, sample_size)
+        ):
             for i, cell in enumerate(row):
                 widths[i] = max(widths[i], len(cell))
 
+        return self._pad_widths(widths)
+
+    def _pad_widths(self, widths: list[int]) -> list[int]:
+        """Adds to the widths of the cells the spaces around them, 2 if the alignment is set to
+        center, 1 otherwise.
+
+        Params
+        ------
+        - `widths` -> A list of the widths of the cells of each column.
+
+        Returns
+        -------
+        A list of integers representing the widths of each column.
+        """
         return list(
             map(
                 lambda x: x + (2 if self.cell_alignment == Alignment.CENTER else 1),
@@ -272,37 +414,102 @@ class CommandLineTable:
 
         return "".join(frame_str_builder)
 
-    def __str__(self) -> str:
-        table_str_builder: list[str] = []
-        widths: list[int] = self._get_max_width_per_column()
+    def _build_row(self, row: list[str], widths: list[int]) -> str:
+        """Uses the currently set options to build the line of a row.
 
-        table: list[list[str]] = [self.headers]
-        table.extend(self.rows)
+        Params
+        ------
+        - `row` -> The cells of the row.
+        - `widths` -> A list of the widths of each column.
 
-        horizontal_frame: str = self._build_hframe(widths)
+        Returns
+        -------
+        A string containing the line of the row.
+        """
+        row_str_builder: list[str] = []
+        for i, cell in enumerate(row):
+            if i == 0 and self.show_vlines:
+                row_str_builder.append(self._VERTICAL_SEPARATOR)
 
-        for row in table:
-            table_str_builder.append(horizontal_frame)
+            if self.cell_alignment == Alignment.CENTER:
+                formatted_cell: str = PrettyStrings.center(cell, widths[i])
+            else:
+                left = self.cell_alignment < 0
+                formatted_cell: str = PrettyStrings.column(cell, widths[i], left)
 
-            row_str_builder: list[str] = []
-            for i, cell in enumerate(row):
-                if i == 0 and self.show_vlines:
-                    row_str_builder.append(self._VERTICAL_SEPARATOR)
+            row_str_builder.append(formatted_cell)
 
-                if self.cell_alignment == Alignment.CENTER:
-                    formatted_cell: str = PrettyStrings.center(cell, widths[i])
-                else:
-                    left = self.cell_alignment < 0
-                    formatted_cell: str = PrettyStrings.column(cell, widths[i], left)
+            if self.show_vlines:
+                row_str_builder.append(self._VERTICAL_SEPARATOR)
+
+        to_join: str = "" if self.show_vlines else " "
+
+        return to_join.join(row_str_builder)
+
+    def iter_lines(
+        self, widths: list[int] | None = None, sample_size: int | None = None
+    ) -> Iterator[str]:
+        """Builds the lines of this table one at a time, so a table with a huge number of rows can
+        be printed without ever building it all in memory. Since the widths of the columns must be
+        known before the first line, they can be given or measured on just the first rows, in which
+        case longer cells in the following rows will be cut off.
+
+        Params
+        ------
+        - `widths` -> The widths of the cells of each column, None to measure them, default: None.
+        - `sample_size` -> The number of rows, from the first one, to measure the widths on, None
+        to measure all of them, default: None.
+
+        Returns
+        -------
+        An iterator over the lines of this table, without the line breaks.
+
+        Raises
+        ------
+        - `ValueError` -> If the widths are not as many as the headers.
+        """
+        if widths is None:
+            widths = self._get_max_width_per_column(sample_size)
+        elif len(widths) != len(self.headers):
+            raise ValueError(
+                " ".join(
+                    [
+                        CommandLineTable._RED_ERROR,
+                        CommandLineTable._WIDTHS_EXCEPTION,
+                    ]
+                )
+            )
+        else:
+            widths = self._pad_widths(widths)
+
+        horizontal_frame: str = self._build_hframe(widths)
 
-                row_str_builder.append(formatted_cell)
+        for row in itertools.chain([self.headers], self.rows):
+            yield horizontal_frame
+            yield self._build_row(row, widths)
 
-                if self.show_vlines:
-                    row_str_builder.append(self._VERTICAL_SEPARATOR)
+        yield horizontal_frame
 
-            to_join: str = "" if self.show_vlines else " "
-            table_str_builder.append(to_join.join(row_str_builder))
+    def write_to(
+        self,
+        stream: TextIO,
+        widths: list[int] | None = None,
+        sample_size: int | None = None,
+    ) -> None:
+        """Writes this table to a text stream one line at a time, see `iter_lines(...)`.
 
-        table_str_builder.append(horizontal_frame)
+        Params
+        ------
+        - `stream` -> The text stream where to write this table, like sys.stdout or a file.
+        - `widths` -> The widths of the cells of each column, None to measure them, default: None.
+        - `sample_size` -> The number of rows, from the first one, to measure the widths on, None
+        to measure all of them, default: None.
 
-        return "\n".join(table_str_builder)
+        Raises
+        ------
+        - `ValueError` -> If the widths are not as many as the headers.
+        """
+        stream.writelines(f"{line}\n" for line in self.iter_lines(widths, sample_size))
+
+    def __str__(self) -> str:
+        return "\n".join(self.iter_lines())
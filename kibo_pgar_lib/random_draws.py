@@ -1,14 +1,335 @@
-"""Module for the RandomDraws class"""
+"""Module used for drawing pseudo-random values.
+
+This module provides:
+- The class RandomStream.
+- The class AliasSampler.
+- The class RandomDraws.
+"""
 
 # Standard Modules
+import array
+import hashlib
+import functools
+import itertools
+import math
+import os
 import random
+import threading
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from typing import Any
+
+# Optional Modules
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+_OUTPUT_ERROR: str = "Unknown output %s, it must be one of: list, array, numpy."
+_NUMPY_ERROR: str = "NumPy is not installed, impossible to draw a NumPy array."
+
+
+def _check_output(output: str) -> None:
+    """Checks that the requested output type of a batched draw is valid and available.
+
+    Params
+    ------
+    - `output` -> The requested output type.
+
+    Raises
+    ------
+    - `ValueError` -> If the output is unknown or NumPy is requested but not installed.
+    """
+    if output not in ("list", "array", "numpy"):
+        raise ValueError(_OUTPUT_ERROR % output)
+
+    if output == "numpy" and numpy is None:
+        raise ValueError(_NUMPY_ERROR)
+
+
+class RandomStream(random.Random):
+    """
+    A seedable pseudo-random generator that can spawn child streams. The children are derived from
+    the seed of their parent in a deterministic way, so parallel jobs using them are reproducible,
+    but they never share the same state.
+    """
+
+    _BITS_BUFFER_SIZE: int = 64
+
+    def __init__(self, seed: Any = None) -> None:
+        """Creates a new stream from the given seed.
+
+        Params
+        ------
+        - `seed` -> The seed of the stream, None to seed it from the operating system, default:
+        None.
+        """
+        self._entropy: bytes = b""
+        self._spawned: int = 0
+        self._bits: int = 0
+        self._bits_left: int = 0
+        super().__init__(seed)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        """Re-seeds this stream, also restarting the sequence of its spawned children.
+
+        Params
+        ------
+        - `a` -> The new seed, None to seed it from the operating system, default: None.
+        - `version` -> The seeding algorithm version, as in random.Random, default: 2.
+        """
+        super().seed(a, version)
+
+        if a is None:
+            self._entropy = os.urandom(32)
+        else:
+            self._entropy = hashlib.sha256(repr(a).encode()).digest()
+        self._spawned = 0
+        self._bits = 0
+        self._bits_left = 0
+
+    def getstate(self) -> tuple:
+        """Gets the internal state of this stream, used for pickling it as well.
+
+        Returns
+        -------
+        A tuple representing the internal state of this stream.
+        """
+        return (
+            super().getstate(),
+            self._entropy,
+            self._spawned,
+            self._bits,
+            self._bits_left,
+        )
+
+    def setstate(self, state: tuple) -> None:
+        """Restores the internal state of this stream.
+
+        Params
+        ------
+        - `state` -> A state previously given by `getstate()`.
+        """
+        super().setstate(state[0])
+        self._entropy, self._spawned, self._bits, self._bits_left = state[1:]
+
+    def spawn(self, k: int) -> list["RandomStream"]:
+        """Derives `k` new independent child streams. Every child is seeded with a hash of the
+        seed of this stream and of its position in the sequence of spawned children, so the same
+        parent always spawns the same children, and spawning again gives new ones.
+
+        Params
+        ------
+        - `k` -> The number of child streams to spawn.
+
+        Returns
+        -------
+        A list of the spawned streams.
+        """
+        children: list[RandomStream] = []
+
+        for i in range(self._spawned, self._spawned + k):
+            digest: bytes = hashlib.sha256(
+                self._entropy + i.to_bytes(8, "little")
+            ).digest()
+            children.append(RandomStream(int.from_bytes(digest, "little")))
+
+        self._spawned += k
+
+        return children
+
+    def random_bool(self) -> bool:
+        """Draws a random bool, handing out one at a time the bits of a 64 bit random word that is
+        drawn again only when all of them have been used.
+
+        Returns
+        -------
+        The drawn boolean.
+        """
+        if not self._bits_left:
+            self._bits = self.getrandbits(RandomStream._BITS_BUFFER_SIZE)
+            self._bits_left = RandomStream._BITS_BUFFER_SIZE
+
+        bit: int = self._bits & 1
+        self._bits >>= 1
+        self._bits_left -= 1
+
+        return bit == 1
+
+    def numpy_generator(self) -> Any:
+        """Creates a NumPy generator seeded from this stream, so that draws made with it stay
+        reproducible when this stream is seeded. NumPy must be installed.
+
+        Returns
+        -------
+        A new NumPy random generator.
+        """
+        return numpy.random.default_rng(self.getrandbits(128))
+
+
+class AliasSampler:
+    """
+    Samples from an arbitrary discrete distribution using the Walker's alias method, in the Vose's
+    variant. The tables are built once from a list of weights, then every draw takes constant time
+    whatever the number of weights.
+    """
+
+    _EMPTY_ERROR: str = "The weights can't be empty."
+    _WEIGHTS_ERROR: str = "The weights must be non negative and not all zeros."
+    _VALUES_ERROR: str = "The values must be as many as the weights."
+
+    def __init__(
+        self, weights: Sequence[float], values: Sequence[Any] | None = None
+    ) -> None:
+        """Builds the alias tables for the given weights.
+
+        Params
+        ------
+        - `weights` -> The relative weights of each outcome.
+        - `values` -> The values to give back for each outcome, None to give back their indexes,
+        default: None.
+
+        Raises
+        ------
+        - `ValueError` -> If the weights are empty, negative or all zeros, or if the values are
+        not as many as the weights.
+        """
+        size: int = len(weights)
+        if size == 0:
+            raise ValueError(AliasSampler._EMPTY_ERROR)
+
+        if values is not None and len(values) != size:
+            raise ValueError(AliasSampler._VALUES_ERROR)
+
+        total: float = math.fsum(weights)
+        if total <= 0 or min(weights) < 0:
+            raise ValueError(AliasSampler._WEIGHTS_ERROR)
+
+        self._values: list[Any] | None = None if values is None else list(values)
+        self._probabilities: list[float] = [weight * size / total for weight in weights]
+        self._aliases: list[int] = list(range(size))
+
+        small: list[int] = [i for i, p in enumerate(self._probabilities) if p < 1]
+        large: list[int] = [i for i, p in enumerate(self._probabilities) if p >= 1]
+
+        while small and large:
+            less: int = small.pop()
+            more: int = large[-1]
+
+            self._aliases[less] = more
+            self._probabilities[more] -= 1 - self._probabilities[less]
+
+            if self._probabilities[more] < 1:
+                small.append(large.pop())
+
+        # What's left is 1 up to rounding errors
+        for i in itertools.chain(small, large):
+            self._probabilities[i] = 1.0
+
+    def __len__(self) -> int:
+        return len(self._probabilities)
+
+    def draw(self, stream: random.Random | None = None) -> Any:
+        """Draws one outcome, using a single random float.
+
+        Params
+        ------
+        - `stream` -> The random stream to draw from, None for the one of the calling thread,
+        default: None.
+
+        Returns
+        -------
+        The drawn value, or its index if no values were given.
+        """
+        stream = stream or RandomDraws.current_stream()
+
+        scaled: float = stream.random() * len(self._probabilities)
+        index: int = int(scaled)
+        if scaled - index >= self._probabilities[index]:
+            index = self._aliases[index]
+
+        return index if self._values is None else self._values[index]
+
+    def draw_many(
+        self, n: int, stream: random.Random | None = None, output: str = "list"
+    ) -> Any:
+        """Draws `n` outcomes in bulk.
+
+        Params
+        ------
+        - `n` -> The number of outcomes to draw.
+        - `stream` -> The random stream to draw from, None for the one of the calling thread,
+        default: None.
+        - `output` -> The type of the result: "list", "array" for an array.array of signed 64 bit
+        integers, only if the outcomes are integers, or "numpy" for a NumPy array, default: "list".
+
+        Returns
+        -------
+        A list, array.array or NumPy array of the drawn values, or of their indexes if no values
+        were given.
+
+        Raises
+        ------
+        - `ValueError` -> If the output is unknown or NumPy is requested but not installed.
+        """
+        _check_output(output)
+        stream = stream or RandomDraws.current_stream()
+        size: int = len(self._probabilities)
+
+        if output == "numpy":
+            # Seeded the same way as RandomStream.numpy_generator(), so any random.Random works
+            generator = numpy.random.default_rng(stream.getrandbits(128))
+            scaled = generator.random(n) * size
+            indexes = scaled.astype(numpy.int64)
+            indexes = numpy.where(
+                scaled - indexes < numpy.asarray(self._probabilities)[indexes],
+                indexes,
+                numpy.asarray(self._aliases)[indexes],
+            )
+
+            return (
+                indexes
+                if self._values is None
+                else numpy.asarray(self._values)[indexes]
+            )
+
+        probabilities: list[float] = self._probabilities
+        aliases: list[int] = self._aliases
+        rand = stream.random
+        drawn: list[Any] = []
+
+        for _ in range(n):
+            scaled = rand() * size
+            index = int(scaled)
+            drawn.append(
+                index if scaled - index < probabilities[index] else aliases[index]
+            )
+
+        if self._values is not None:
+            drawn = list(map(self._values.__getitem__, drawn))
+
+        return array.array("q", drawn) if output == "array" else drawn
 
 
 class RandomDraws:
     """This class provides methods for drawing a specific data type in a pseudo-random way."""
 
-    _RAND = random.Random()
+    # Every thread draws from its own stream, see current_stream()
+    _LOCAL = threading.local()
     _CONSTRUCTOR_ERROR: str = "This class is not instantiable!"
+    _DISTINCT_ERROR: str = (
+        "Impossible to draw %d distinct integers from the given range."
+    )
+    # Up to this many distinct integers are drawn with the Floyd's algorithm
+    _FLOYD_LIMIT: int = 1 << 16
+    # Ranges up to this size are lazily shuffled, exactly uniform, instead of permuted by the
+    # Feistel network, whose few keys can't reach every permutation of a small range
+    _SHUFFLE_LIMIT: int = 1 << 16
+    _FEISTEL_ROUNDS: int = 6
+    _FEISTEL_MULTIPLIER: int = 0x9E3779B97F4A7C15
+    _RANGE_ERROR: str = "The minimum can't be greater than the maximum."
+    _BYTE_TO_BOOLS: list[tuple[bool, ...]] = [
+        tuple(bool(byte >> bit & 1) for bit in range(8)) for byte in range(256)
+    ]
 
     def __init__(self) -> None:
         """Prevents the instantiation of this class.
@@ -19,6 +340,57 @@ class RandomDraws:
         """
         raise NotImplementedError(RandomDraws._CONSTRUCTOR_ERROR)
 
+    @staticmethod
+    def stream(seed: Any = None) -> RandomStream:
+        """Creates a new independent random stream.
+
+        Params
+        ------
+        - `seed` -> The seed of the stream, None to seed it from the operating system, default:
+        None.
+
+        Returns
+        -------
+        The new random stream.
+        """
+        return RandomStream(seed)
+
+    @staticmethod
+    def current_stream() -> RandomStream:
+        """Gets the stream all the draws of the calling thread come from. Every thread gets its
+        own stream, seeded from the operating system the first time it draws, so threads never
+        contend on the same state, and forked processes start with new streams too.
+
+        Returns
+        -------
+        The random stream of the calling thread.
+        """
+        stream: RandomStream | None = getattr(RandomDraws._LOCAL, "stream", None)
+
+        if stream is None:
+            stream = RandomStream()
+            RandomDraws._LOCAL.stream = stream
+
+        return stream
+
+    @staticmethod
+    def set_stream(stream: RandomStream) -> None:
+        """Sets the stream all the draws of the calling thread will come from, for example one
+        seeded for reproducibility or one spawned by a parent stream.
+
+        Params
+        ------
+        - `stream` -> The random stream to use in the calling thread.
+        """
+        RandomDraws._LOCAL.stream = stream
+
+    @staticmethod
+    def _reset_streams() -> None:
+        """Forgets the streams of all the threads, used in forked processes so that they don't
+        draw the same numbers of their parent.
+        """
+        RandomDraws._LOCAL = threading.local()
+
     @staticmethod
     def draw_integer(minimum: int, maximum: int) -> int:
         """Draws a random integer between given minimum and maximum values included.
@@ -32,7 +404,7 @@ class RandomDraws:
         -------
         An integer representing the drawn number.
         """
-        return RandomDraws._RAND.randint(minimum, maximum)
+        return RandomDraws.current_stream().randint(minimum, maximum)
 
     @staticmethod
     def draw_float(minimum: float, maximum: float) -> float:
@@ -47,11 +419,11 @@ class RandomDraws:
         -------
         An float representing the drawn number.
         """
-        return RandomDraws._RAND.uniform(minimum, maximum)
+        return RandomDraws.current_stream().uniform(minimum, maximum)
 
     @staticmethod
     def draw_integer_with_distribution(
-        minimum: int, maximum: int, exponent: float
+        minimum: int, maximum: int, exponent: float, use_table: bool = False
     ) -> int:
         """Draws a random integer between given minimum and maximum values, with a certain
         distribution. In order to distribute the values you use the exponent:
@@ -68,16 +440,53 @@ class RandomDraws:
         - `minimum` -> The minimum value to draw.
         - `maximum` -> The maximum value to draw.
         - `exponent` -> The exponent of the distribution.
+        - `use_table` -> If the draw should come from the precomputed table given by
+        `distribution_sampler(...)` instead of computing a power every time, only for positive
+        exponents, default: False.
 
         Returns
         -------
         An integer representing the drawn number.
         """
+        if use_table and exponent > 0:
+            return RandomDraws.distribution_sampler(minimum, maximum, exponent).draw()
+
         drawing_range: int = maximum + 1 - minimum
-        random_float: float = RandomDraws._RAND.random() ** exponent
+        random_float: float = RandomDraws.current_stream().random() ** exponent
 
         return minimum + int(drawing_range * random_float)
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def distribution_sampler(
+        minimum: int, maximum: int, exponent: float
+    ) -> AliasSampler:
+        """Builds the alias sampler of the distribution used by
+        `draw_integer_with_distribution(...)`, with the exact probability of each value. Samplers
+        are cached, so asking again for the same minimum, maximum and positive exponent gives back
+        the same sampler.
+
+        Params
+        ------
+        - `minimum` -> The minimum value to draw.
+        - `maximum` -> The maximum value to draw.
+        - `exponent` -> The exponent of the distribution, must be positive.
+
+        Returns
+        -------
+        The alias sampler of the distribution.
+        """
+        drawing_range: int = maximum + 1 - minimum
+        # The k-th value is drawn when k / range <= random^exponent < (k + 1) / range
+        bounds: list[float] = [
+            (k / drawing_range) ** (1 / exponent) for k in range(drawing_range + 1)
+        ]
+
+        return AliasSampler(
+            [high - low for low, high in zip(bounds, bounds[1:])],
+            range(minimum, maximum + 1),
+        )
+
     @staticmethod
     def draw_bool() -> bool:
         """Draws a random bool.
@@ -86,4 +495,358 @@ class RandomDraws:
         -------
         The drawn boolean.
         """
-        return RandomDraws._RAND.choice([True, False])
+        return RandomDraws.current_stream().random_bool()
+
+    @staticmethod
+    def draw_bits(n: int) -> int:
+        """Draws `n` random bits packed in an integer.
+
+        Params
+        ------
+        - `n` -> The number of bits to draw.
+
+        Returns
+        -------
+        A non negative integer smaller than 2^`n` whose bits are the drawn ones.
+        """
+        return RandomDraws.current_stream().getrandbits(n)
+
+    @staticmethod
+    def draw_bool_mask(n: int) -> bytes:
+        """Draws `n` random bools packed as the bits of a bytes object, the i-th bool being the
+        bit i % 8 of the byte i // 8. The unused high bits of the last byte are always 0.
+
+        Params
+        ------
+        - `n` -> The number of bools to draw.
+
+        Returns
+        -------
+        A bytes object of (`n` + 7) // 8 bytes containing the drawn bools.
+        """
+        return RandomDraws.draw_bits(n).to_bytes((n + 7) // 8, "little")
+
+    @staticmethod
+    def draw_integers(minimum: int, maximum: int, n: int, output: str = "list") -> Any:
+        """Draws `n` random integers between given minimum and maximum values included, generating
+        them in bulk.
+
+        Params
+        ------
+        - `minimum` -> The minimum value to draw.
+        - `maximum` -> The maximum value to draw.
+        - `n` -> The number of integers to draw.
+        - `output` -> The type of the result: "list", "array" for an array.array of signed 64 bit
+        integers or "numpy" for a NumPy array, default: "list".
+
+        Returns
+        -------
+        A list, array.array or NumPy array of the drawn numbers.
+
+        Raises
+        ------
+        - `ValueError` -> If the minimum is greater than the maximum, if the output is unknown or
+        NumPy is requested but not installed.
+        """
+        _check_output(output)
+
+        if minimum > maximum:
+            raise ValueError(RandomDraws._RANGE_ERROR)
+
+        if output == "numpy":
+            return (
+                RandomDraws.current_stream()
+                .numpy_generator()
+                .integers(minimum, maximum, n, endpoint=True)
+            )
+
+        # Like randint(...), just enough random bits are drawn and the values out of the range
+        # are rejected, so every value is exactly as likely, less than half are rejected
+        drawing_range: int = maximum + 1 - minimum
+        bits: int = drawing_range.bit_length()
+        getrandbits = RandomDraws.current_stream().getrandbits
+        drawn: list[int] = []
+
+        while len(drawn) < n:
+            drawn.extend(
+                minimum + value
+                for value in (getrandbits(bits) for _ in range(n - len(drawn)))
+                if value < drawing_range
+            )
+
+        return array.array("q", drawn) if output == "array" else drawn
+
+    @staticmethod
+    def draw_floats(
+        minimum: float, maximum: float, n: int, output: str = "list"
+    ) -> Any:
+        """Draws `n` random floats between given minimum and maximum values included, generating
+        them in bulk.
+
+        Params
+        ------
+        - `minimum` -> The minimum value to draw.
+        - `maximum` -> The maximum value to draw.
+        - `n` -> The number of floats to draw.
+        - `output` -> The type of the result: "list", "array" for an array.array of doubles or
+        "numpy" for a NumPy array, default: "list".
+
+        Returns
+        -------
+        A list, array.array or NumPy array of the drawn numbers.
+
+        Raises
+        ------
+        - `ValueError` -> If the output is unknown or NumPy is requested but not installed.
+        """
+        _check_output(output)
+
+        if output == "numpy":
+            return (
+                RandomDraws.current_stream()
+                .numpy_generator()
+                .uniform(minimum, maximum, n)
+            )
+
+        span: float = maximum - minimum
+        rand = RandomDraws.current_stream().random
+        drawn: list[float] = [minimum + span * rand() for _ in range(n)]
+
+        return array.array("d", drawn) if output == "array" else drawn
+
+    @staticmethod
+    def draw_bools(n: int, output: str = "list") -> Any:
+        """Draws `n` random bools, generating all their bits at once.
+
+        Params
+        ------
+        - `n` -> The number of bools to draw.
+        - `output` -> The type of the result: "list", "array" for an array.array of unsigned bytes
+        valued 0 or 1 or "numpy" for a NumPy bool array, default: "list".
+
+        Returns
+        -------
+        A list, array.array or NumPy array of the drawn bools.
+
+        Raises
+        ------
+        - `ValueError` -> If the output is unknown or NumPy is requested but not installed.
+        """
+        _check_output(output)
+
+        if output == "numpy":
+            return (
+                RandomDraws.current_stream()
+                .numpy_generator()
+                .integers(0, 2, n, dtype=bool)
+            )
+
+        bits: bytes = RandomDraws.draw_bool_mask(n)
+        drawn: list[bool] = list(
+            itertools.chain.from_iterable(
+                map(RandomDraws._BYTE_TO_BOOLS.__getitem__, bits)
+            )
+        )
+        del drawn[n:]
+
+        return array.array("B", drawn) if output == "array" else drawn
+
+    @staticmethod
+    def _random_open(rand: Callable[[], float]) -> float:
+        """Draws a random float strictly between 0 and 1.
+
+        Params
+        ------
+        - `rand` -> The function drawing floats between 0 included and 1 excluded.
+
+        Returns
+        -------
+        The drawn float.
+        """
+        drawn: float = rand()
+
+        while drawn == 0.0:
+            drawn = rand()
+
+        return drawn
+
+    @staticmethod
+    def sample_iterable(iterable: Iterable[Any], k: int) -> list[Any]:
+        """Draws `k` random items from an iterable of any length, even unknown, in a single pass
+        and keeping only `k` items in memory, using the reservoir sampling Algorithm L. The number
+        of items to skip between two replacements is drawn directly, so most of the items are
+        consumed without drawing anything at all.
+
+        Params
+        ------
+        - `iterable` -> The iterable to draw the items from.
+        - `k` -> The number of items to draw.
+
+        Returns
+        -------
+        A list of the drawn items, in no particular order, with all the items of the iterable if it
+        had less than `k` of them.
+        """
+        iterator: Iterator[Any] = iter(iterable)
+        reservoir: list[Any] = list(itertools.islice(iterator, k))
+
+        if k <= 0 or len(reservoir) < k:
+            return reservoir
+
+        stream: RandomStream = RandomDraws.current_stream()
+        weight: float = math.exp(math.log(RandomDraws._random_open(stream.random)) / k)
+        end: object = object()
+
+        while True:
+            skip: int = math.floor(
+                math.log(RandomDraws._random_open(stream.random)) / math.log(1 - weight)
+            )
+            item: Any = next(itertools.islice(iterator, skip, None), end)
+
+            if item is end:
+                return reservoir
+
+            reservoir[stream.randrange(k)] = item
+            weight *= math.exp(math.log(RandomDraws._random_open(stream.random)) / k)
+
+    @staticmethod
+    def _check_distinct(minimum: int, maximum: int, k: int) -> None:
+        """Checks that `k` distinct integers can be drawn between the given minimum and maximum.
+
+        Params
+        ------
+        - `minimum` -> The minimum value to draw.
+        - `maximum` -> The maximum value to draw.
+        - `k` -> The number of integers to draw.
+
+        Raises
+        ------
+        - `ValueError` -> If `k` is negative or greater than the number of integers in the range.
+        """
+        if not 0 <= k <= maximum + 1 - minimum:
+            raise ValueError(RandomDraws._DISTINCT_ERROR % k)
+
+    @staticmethod
+    def _iter_shuffled(
+        minimum: int, size: int, k: int, stream: RandomStream
+    ) -> Iterator[int]:
+        """Lazily draws the first `k` integers of a Fisher-Yates shuffle of a range, keeping only
+        the positions that were swapped.
+
+        Params
+        ------
+        - `minimum` -> The minimum value of the range.
+        - `size` -> The number of integers in the range.
+        - `k` -> The number of integers to draw.
+        - `stream` -> The random stream to draw from.
+
+        Returns
+        -------
+        An iterator over the drawn integers.
+        """
+        swapped: dict[int, int] = {}
+
+        for i in range(k):
+            j: int = stream.randrange(i, size)
+            value: int = swapped.get(j, j)
+            swapped[j] = swapped.pop(i, i)
+
+            yield minimum + value
+
+    @staticmethod
+    def iter_distinct_integers(minimum: int, maximum: int, k: int) -> Iterator[int]:
+        """Lazily draws `k` distinct random integers between given minimum and maximum values
+        included. Ranges with up to 65536 integers are lazily shuffled, so every ordering is
+        equally likely and the memory used grows with the integers drawn. Bigger ranges use the
+        first `k` values of a pseudo-random permutation, built with a keyed Feistel network, so
+        the memory used doesn't depend on the size of the range nor on `k`, but the orderings
+        aren't exactly equally likely.
+
+        Params
+        ------
+        - `minimum` -> The minimum value to draw.
+        - `maximum` -> The maximum value to draw.
+        - `k` -> The number of integers to draw.
+
+        Returns
+        -------
+        An iterator over the drawn integers.
+
+        Raises
+        ------
+        - `ValueError` -> If `k` is negative or greater than the number of integers in the range.
+        """
+        RandomDraws._check_distinct(minimum, maximum, k)
+
+        size: int = maximum + 1 - minimum
+        stream: RandomStream = RandomDraws.current_stream()
+
+        if size <= RandomDraws._SHUFFLE_LIMIT:
+            yield from RandomDraws._iter_shuffled(minimum, size, k, stream)
+            return
+
+        half_bits: int = max(1, ((size - 1).bit_length() + 1) // 2)
+        mask: int = (1 << half_bits) - 1
+        keys: list[int] = [
+            stream.getrandbits(max(64, half_bits))
+            for _ in range(RandomDraws._FEISTEL_ROUNDS)
+        ]
+
+        for value in range(k):
+            # Cycle walking, the permutation is over a power of 4 at most 4 times the range
+            while True:
+                left, right = value >> half_bits, value & mask
+
+                for key in keys:
+                    mixed: int = (right ^ key) * RandomDraws._FEISTEL_MULTIPLIER
+                    left, right = right, left ^ ((mixed ^ mixed >> half_bits) & mask)
+
+                value = left << half_bits | right
+                if value < size:
+                    break
+
+            yield minimum + value
+
+    @staticmethod
+    def draw_distinct_integers(minimum: int, maximum: int, k: int) -> list[int]:
+        """Draws `k` distinct random integers between given minimum and maximum values included,
+        without ever building the whole range. Up to a certain `k` the Floyd's algorithm is used,
+        beyond it the integers come from `iter_distinct_integers(...)` so no set of the already
+        drawn ones is kept.
+
+        Params
+        ------
+        - `minimum` -> The minimum value to draw.
+        - `maximum` -> The maximum value to draw.
+        - `k` -> The number of integers to draw.
+
+        Returns
+        -------
+        A list of the drawn integers, in random order.
+
+        Raises
+        ------
+        - `ValueError` -> If `k` is negative or greater than the number of integers in the range.
+        """
+        RandomDraws._check_distinct(minimum, maximum, k)
+
+        if k > RandomDraws._FLOYD_LIMIT:
+            return list(RandomDraws.iter_distinct_integers(minimum, maximum, k))
+
+        stream: RandomStream = RandomDraws.current_stream()
+        size: int = maximum + 1 - minimum
+        selected: set[int] = set()
+
+        for j in range(size - k, size):
+            drawn: int = stream.randint(0, j)
+            selected.add(j if drawn in selected else drawn)
+
+        drawn_list: list[int] = [minimum + value for value in selected]
+        stream.shuffle(drawn_list)
+
+        return drawn_list
+
+
+if hasattr(os, "register_at_fork"):
+    # pylint: disable-next=protected-access
+    os.register_at_fork(after_in_child=RandomDraws._reset_streams)